@@ -64,10 +64,17 @@ class Settings(BaseSettings):
     WEAVIATE_HOST: str = "weaviate"
     WEAVIATE_PORT: int = 8080
     WEAVIATE_GRPC_PORT: int = 50051
+    WEAVIATE_VECTOR_COMPRESSION: str = "bq"  # "bq", "pq" (needs Weaviate ASYNC_INDEXING=true) or "none" — applied when seed.py creates the collection
 
     # Knowledge Base
     KNOWLEDGE_BASE_PATH: str = "./Company_Documents"
     EMBEDDING_MODEL: str = "BAAI/bge-m3"
+    EMBEDDING_BACKEND: str = "api"  # seed-time: "api" (HF router), "local" (sentence-transformers), or "auto" (local if installed)
+    EMBEDDING_BATCH_SIZE: int = 32  # texts per HF feature-extraction request
+    EMBEDDING_CONCURRENCY: int = 4  # batches in flight at once; lower if HF returns 429s
+    EMBEDDING_CACHE_PATH: str = "./.embedding_cache.sqlite"  # seed-time vector cache; "" disables
+    ENTITY_CACHE_PATH: str = "./.entity_cache.sqlite"  # seed-time spaCy NER cache; "" disables
+    DOCUMENT_CACHE_PATH: str = "./.document_cache.sqlite"  # seed-time parsed-file cache (path+mtime+size); "" disables
 
     # Parse ALLOWED_ORIGINS from JSON string in .env
     @field_validator('ALLOWED_ORIGINS', mode='before')
@@ -1,13 +1,18 @@
 """
-Shared embeddings module — single source of truth for MultiFallbackEmbeddings.
+Shared embeddings module — single source of truth for MultiFallbackEmbeddings
+and the optional in-process LocalEmbeddings backend.
 
 Used by both seed.py (ingestion) and rag_service.py (query-time).
 """
 import logging
+import threading
 import time
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -23,31 +28,53 @@ class MultiFallbackEmbeddings:
     PRIMARY_MODEL = "BAAI/bge-m3"                  # 1024 dims — best quality
     FALLBACK_MODELS = ["BAAI/bge-large-en-v1.5"]   # 1024 dims — fallback
     MAX_RETRIES = 3
-
-    def __init__(self, api_key: str, model_name: str = ""):
+    BATCH_SIZE = 32                                # texts per HF request
+    CONCURRENCY = 4                                # batches in flight at once
+    QUERY_CACHE_SIZE = 256                         # recent query vectors kept in memory
+
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str = "",
+        batch_size: int = BATCH_SIZE,
+        concurrency: int = CONCURRENCY,
+    ):
         self.api_key = api_key
         self.model_name = model_name
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
         self.working_model: Optional[str] = None
+        # One pooled session shared by all worker threads: TCP + TLS to the
+        # HF router are set up once per connection, not once per request.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.concurrency, pool_maxsize=self.concurrency
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers["Authorization"] = f"Bearer {api_key}"
+        # Repeated / follow-up chat queries skip the HF round trip entirely
+        self._query_cache: "OrderedDict[str, Tuple[float, ...]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
 
     # ── low-level helpers ──────────────────────────────────────────────
 
-    def _try_requests(self, text: str, model: str, timeout: int = 60):
+    def _try_requests(self, inputs, model: str, timeout: int = 60):
         url = (
             f"https://router.huggingface.co/hf-inference/models/"
             f"{model}/pipeline/feature-extraction"
         )
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        resp = requests.post(
-            url, headers=headers, json={"inputs": text}, timeout=timeout
-        )
+        resp = self._session.post(url, json={"inputs": inputs}, timeout=timeout)
         resp.raise_for_status()
         return resp.json()
 
-    def _try_model(self, text: str, model: str):
+    def _try_model(self, inputs, model: str):
+        expected = len(inputs) if isinstance(inputs, list) else None
         for attempt in range(self.MAX_RETRIES):
             try:
-                result = self._try_requests(text, model)
-                if result and len(result) > 0:
+                result = self._try_requests(inputs, model)
+                if result and len(result) > 0 and (
+                    expected is None or len(result) == expected
+                ):
                     if self.working_model != model:
                         logger.info(f"Embedding model: {model} (1024-dim)")
                         self.working_model = model
@@ -68,28 +95,140 @@ class MultiFallbackEmbeddings:
 
     # ── public API ─────────────────────────────────────────────────────
 
-    def embed_query(self, text: str):
-        """Return a 1024-dim embedding vector for *text*."""
+    def _embed_with_model(self, inputs) -> Tuple[Any, str]:
+        """_embed() plus the name of the model that produced the result."""
         # 1. Try cached working model
-        if self.working_model:
-            result = self._try_model(text, self.working_model)
+        working = self.working_model
+        if working:
+            result = self._try_model(inputs, working)
             if result:
-                return result
+                return result, working
             self.working_model = None
 
         # 2. Try primary
-        result = self._try_model(text, self.PRIMARY_MODEL)
+        result = self._try_model(inputs, self.PRIMARY_MODEL)
         if result:
-            return result
+            return result, self.PRIMARY_MODEL
 
         # 3. Try fallbacks
         for model in self.FALLBACK_MODELS:
-            result = self._try_model(text, model)
+            result = self._try_model(inputs, model)
             if result:
-                return result
+                return result, model
 
         raise ValueError("All embedding models failed after retries")
 
+    def _embed(self, inputs):
+        return self._embed_with_model(inputs)[0]
+
+    def embed_query(self, text: str):
+        """Return a 1024-dim embedding vector for *text* (LRU-cached).
+
+        Only vectors from the configured model are cached; a fallback
+        model's vector lives in a different space and must not be reused
+        once the primary model is back.
+        """
+        with self._query_cache_lock:
+            cached = self._query_cache.get(text)
+            if cached is not None:
+                self._query_cache.move_to_end(text)
+                return list(cached)
+
+        vector, model = self._embed_with_model(text)
+        if model == (self.model_name or self.PRIMARY_MODEL):
+            with self._query_cache_lock:
+                self._query_cache[text] = tuple(vector)
+                self._query_cache.move_to_end(text)
+                while len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        return list(vector)
+
+    def _embed_batch(self, batch: List[str]) -> List[Tuple[List[float], str]]:
+        try:
+            vectors, model = self._embed_with_model(batch)
+            return [(vec, model) for vec in vectors]
+        except ValueError:
+            logger.warning(
+                f"Batch of {len(batch)} failed, falling back to per-text embedding"
+            )
+            return [self._embed_with_model(t) for t in batch]
+
+    def embed_documents(self, texts: List[str]):
+        """Embed *texts* in batches of batch_size, one HTTP request per batch.
+
+        Up to ``concurrency`` batches are in flight at once; results keep
+        input order. If a whole batch fails on every model, its texts are
+        retried one by one so a single bad input doesn't sink its neighbours.
+        """
+        return [vec for vec, _ in self.embed_documents_with_models(texts)]
+
+    def embed_documents_with_models(self, texts: List[str]) -> List[Tuple[List[float], str]]:
+        """embed_documents(), pairing each vector with the model that produced it.
+
+        Batches may land on different models (primary vs fallback), so
+        callers that persist vectors can tell which vector space each is in.
+        """
+        batches = [
+            texts[start:start + self.batch_size]
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        if self.concurrency == 1 or len(batches) <= 1:
+            results = map(self._embed_batch, batches)
+            return [pair for batch in results for pair in batch]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.concurrency, len(batches)),
+            thread_name_prefix="embed",
+        ) as pool:
+            return [pair for batch in pool.map(self._embed_batch, batches) for pair in batch]
+
+
+class LocalEmbeddings:
+    """In-process sentence-transformers embeddings for bulk ingestion.
+
+    Runs the same BAAI/bge-m3 weights the Inference API serves, so seeded
+    vectors stay comparable with the query-time MultiFallbackEmbeddings
+    vectors (1024-dim, L2-normalised).  Requires the optional
+    ``sentence-transformers`` package; the constructor raises ImportError
+    when it isn't installed so callers can fall back to the API.
+    """
+
+    BATCH_SIZE = 64
+
+    def __init__(
+        self,
+        model_name: str = MultiFallbackEmbeddings.PRIMARY_MODEL,
+        batch_size: int = BATCH_SIZE,
+        device: Optional[str] = None,
+    ):
+        # Imported lazily: torch is heavy and only seed.py needs it
+        from sentence_transformers import SentenceTransformer
+
+        self.model_name = model_name or MultiFallbackEmbeddings.PRIMARY_MODEL
+        self.batch_size = max(1, batch_size)
+        self.concurrency = 1
+        self.model = SentenceTransformer(self.model_name, device=device)
+
+    def _encode(self, texts: List[str]):
+        vectors = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return vectors.tolist()
+
+    def embed_query(self, text: str):
+        """Return a 1024-dim embedding vector for *text*."""
+        return self._encode([text])[0]
+
     def embed_documents(self, texts: List[str]):
-        """Embed a batch of texts sequentially."""
-        return [self.embed_query(t) for t in texts]
+        """Embed *texts* in one vectorised pass, batch_size texts at a time."""
+        if not texts:
+            return []
+        return self._encode(texts)
+
+    def embed_documents_with_models(self, texts: List[str]) -> List[Tuple[List[float], str]]:
+        """embed_documents() paired with the model name (always self.model_name)."""
+        return [(vec, self.model_name) for vec in self.embed_documents(texts)]
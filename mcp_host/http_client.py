@@ -0,0 +1,30 @@
+"""
+Shared async HTTP client for the MCP Host.
+
+One process-wide httpx.AsyncClient so every outbound caller (OpenAI SDK,
+Hugging Face inference, ...) shares a single connection pool and TLS
+session cache instead of opening its own.
+"""
+import logging
+from functools import lru_cache
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    logger.info("Creating shared HTTP client")
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
+
+
+async def close_http_client() -> None:
+    """Close the shared client (called from the FastAPI shutdown hook)."""
+    if get_http_client.cache_info().currsize:
+        await get_http_client().aclose()
+        get_http_client.cache_clear()
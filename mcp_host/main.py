@@ -43,6 +43,7 @@ from .models import (
     UserProfileResponse, HealthResponse
 )
 from .auth import hash_password, verify_password, create_access_token, decode_token
+from .http_client import close_http_client
 
 
 def get_token_from_header(authorization: str) -> Optional[str]:
@@ -134,6 +135,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down MCP Host...")
     await state_manager.shutdown()
+    await close_http_client()
     logger.info("MCP Host shut down")
 
 
@@ -100,10 +100,20 @@ class RAGService:
         await loop.run_in_executor(None, self._sync_connect)
 
     @staticmethod
-    def _safe_parse_entities(raw: str) -> dict:
-        """Parse entities JSON safely — returns {} on any failure."""
+    def _safe_parse_entities(raw) -> dict:
+        """Turn the stored entities into {label: [values]} — returns {} on any failure.
+
+        Current collections store a native OBJECT[] of {label, values};
+        collections seeded before that stored a JSON string.
+        """
         if not raw:
             return {}
+        if isinstance(raw, list):
+            return {
+                obj["label"]: list(obj.get("values") or [])
+                for obj in raw
+                if isinstance(obj, dict) and obj.get("label")
+            }
         try:
             return json.loads(raw)
         except (json.JSONDecodeError, TypeError):
@@ -229,7 +239,7 @@ class RAGService:
                     'section_title': item.properties.get('section_title', ''),
                     'parent_id': item.properties.get('parent_id', ''),
                     'full_text': item.properties.get('full_text', ''),
-                    'entities': self._safe_parse_entities(item.properties.get('entities', '{}')),
+                    'entities': self._safe_parse_entities(item.properties.get('entities')),
                     'distance': item.metadata.distance
                 })
             
@@ -5,10 +5,22 @@ This module contains reusable components like retry decorators and circuit break
 to make the application more robust against transient failures of external services.
 """
 import logging
-from tenacity import retry, stop_after_attempt, wait_random_exponential, retry_if_exception
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_random_exponential,
+    wait_exponential_jitter,
+    retry_if_exception,
+)
 from httpx import HTTPStatusError
 from pybreaker import CircuitBreaker
 
+try:
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+    _OPENAI_TRANSIENT_ERRORS: tuple = (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError)
+except ImportError:
+    _OPENAI_TRANSIENT_ERRORS = ()
+
 logger = logging.getLogger(__name__)
 
 # --- Retry Strategy ---
@@ -35,6 +47,35 @@ api_retry_strategy = retry(
 )
 
 
+def is_transient_openai_error(exception: BaseException) -> bool:
+    """
+    Determines if an OpenAI SDK exception is transient (rate limit, timeout, 5xx).
+    """
+    return bool(_OPENAI_TRANSIENT_ERRORS) and isinstance(exception, _OPENAI_TRANSIENT_ERRORS)
+
+
+OPENAI_MAX_ATTEMPTS = 3
+
+
+def _log_openai_retry(retry_state) -> None:
+    logger.warning(
+        f"Retrying OpenAI call (attempt {retry_state.attempt_number}/{OPENAI_MAX_ATTEMPTS}): "
+        f"{retry_state.outcome.exception()}"
+    )
+
+# Retry decorator for OpenAI SDK calls.
+# Stops after OPENAI_MAX_ATTEMPTS, backing off exponentially from 0.5s (max 8s) with jitter.
+# Clients used with it must be built with max_retries=0, or the SDK's own
+# retries multiply with these.
+openai_retry_strategy = retry(
+    stop=stop_after_attempt(OPENAI_MAX_ATTEMPTS),
+    wait=wait_exponential_jitter(initial=0.5, max=8),
+    retry=retry_if_exception(is_transient_openai_error),
+    before_sleep=_log_openai_retry,
+    reraise=True
+)
+
+
 # --- Circuit Breaker Strategy ---
 
 # A dictionary to hold circuit breakers for various services.
@@ -1,17 +1,18 @@
 """Voice Processing Service - STT and TTS with Multiple Fallbacks"""
 
 import logging
-import io
 import asyncio
 from typing import Optional, Tuple
 import os
-import httpx
+
+from .http_client import get_http_client
+from .resilience import openai_retry_strategy
 
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI
     _OPENAI_AVAILABLE = True
 except ImportError:
-    OpenAI = None  # type: ignore
+    AsyncOpenAI = None  # type: ignore
     _OPENAI_AVAILABLE = False
 
 # Edge TTS (Free, High Quality)
@@ -39,11 +40,11 @@ class VoiceService:
     def __init__(self):
         # OpenAI (Primary - best quality, costs money)
         self.openai_key = os.environ.get("OPENAI_API_KEY")
+        self._openai_client = None  # Built on first use, bound to the current shared HTTP client
+        self._openai_http = None
         if not self.openai_key:
             logger.warning("⚠️ OPENAI_API_KEY not set - using free alternatives")
-            self.client = None
         else:
-            self.client = OpenAI(api_key=self.openai_key)
             logger.info("✓ Voice service initialized with OpenAI (primary)")
         
         # Edge TTS (Free, high quality - recommended fallback)
@@ -56,7 +57,7 @@ class VoiceService:
         self.hf_token = os.environ.get("HUGGINGFACE_API_KEY") or os.environ.get("HF_TOKEN")
         if self.hf_token:
             logger.info("✓ Hugging Face API token found (STT fallback enabled)")
-        elif not self.client:
+        elif not self.openai_key:
             logger.warning("⚠️ No OPENAI_API_KEY or HUGGINGFACE_API_KEY - STT limited")
         
         # Hugging Face model endpoints
@@ -71,6 +72,60 @@ class VoiceService:
         # Default Edge voice
         self.default_edge_voice = os.environ.get("EDGE_TTS_VOICE", "en-US-JennyNeural")
     
+    AUDIO_CONTENT_TYPES = {
+        "webm": "audio/webm",
+        "mp3": "audio/mpeg",
+        "wav": "audio/wav",
+        "flac": "audio/flac",
+        "m4a": "audio/m4a",
+        "ogg": "audio/ogg",
+    }
+
+    @property
+    def client(self):
+        """OpenAI client on the shared HTTP pool, or None without an API key.
+
+        Resolved per use rather than in __init__: close_http_client() closes
+        the shared pool on shutdown, and a later get_http_client() hands out
+        a fresh one that the SDK client must be rebuilt around.
+        """
+        if not self.openai_key:
+            return None
+        http = get_http_client()
+        if self._openai_client is None or self._openai_http is not http:
+            # SDK retries off: openai_retry_strategy owns retrying, so one call
+            # makes at most OPENAI_MAX_ATTEMPTS requests rather than 3 x 3
+            self._openai_client = AsyncOpenAI(
+                api_key=self.openai_key, http_client=http, max_retries=0
+            )
+            self._openai_http = http
+        return self._openai_client
+
+    @classmethod
+    def _audio_content_type(cls, filename: str) -> str:
+        """Map an audio filename extension to its MIME type (defaults to webm)"""
+        ext = filename.lower().rsplit('.', 1)[-1] if '.' in filename else 'webm'
+        return cls.AUDIO_CONTENT_TYPES.get(ext, 'audio/webm')
+
+    @openai_retry_strategy
+    async def _openai_transcribe(self, file: Tuple[str, bytes, str]) -> str:
+        """Whisper transcription, retried on rate limits / timeouts / 5xx"""
+        return await self.client.audio.transcriptions.create(
+            model="whisper-1",
+            file=file,
+            response_format="text"
+        )
+
+    @openai_retry_strategy
+    async def _openai_speech(self, text: str, voice: str, model: str) -> bytes:
+        """OpenAI TTS, retried on rate limits / timeouts / 5xx"""
+        response = await self.client.audio.speech.create(
+            model=model,
+            voice=voice,
+            input=text
+        )
+        return response.content
+
     async def speech_to_text(self, audio_data: bytes, filename: str = "audio.webm") -> str:
         """
         Convert audio to text using OpenAI Whisper (primary) or Hugging Face (fallback)
@@ -85,13 +140,10 @@ class VoiceService:
         # Try OpenAI first
         if self.client:
             try:
-                audio_file = io.BytesIO(audio_data)
-                audio_file.name = filename
-                
-                transcript = self.client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    response_format="text"
+                # (filename, bytes, mime) tuple goes straight into the multipart
+                # body - no BytesIO copy of the audio
+                transcript = await self._openai_transcribe(
+                    (filename, audio_data, self._audio_content_type(filename))
                 )
                 
                 logger.info(f"🎤 STT (OpenAI): '{transcript[:50]}...'")
@@ -110,17 +162,7 @@ class VoiceService:
             last_error = None
             
             # Determine content type from filename
-            content_type = "audio/webm"
-            ext = filename.lower().split('.')[-1] if '.' in filename else 'webm'
-            content_types = {
-                'webm': 'audio/webm',
-                'mp3': 'audio/mpeg',
-                'wav': 'audio/wav',
-                'flac': 'audio/flac',
-                'm4a': 'audio/m4a',
-                'ogg': 'audio/ogg',
-            }
-            content_type = content_types.get(ext, 'audio/webm')
+            content_type = self._audio_content_type(filename)
             
             for model in models_to_try:
                 try:
@@ -132,30 +174,29 @@ class VoiceService:
                     
                     logger.info(f"🎤 Trying STT model {model} with {content_type}...")
                     
-                    async with httpx.AsyncClient(timeout=60.0) as client:
-                        response = await client.post(url, headers=headers, content=audio_data)
-                        
-                        # Check for model loading (503) or unsupported format
-                        if response.status_code == 503:
-                            logger.warning(f"⚠️ Model {model} is loading, trying next...")
-                            continue
-                        
-                        if response.status_code == 400:
-                            error_detail = response.text
-                            logger.warning(f"⚠️ Model {model} rejected audio: {error_detail[:100]}")
-                            continue
-                            
-                        response.raise_for_status()
-                        result = response.json()
+                    response = await get_http_client().post(url, headers=headers, content=audio_data, timeout=60.0)
+                    
+                    # Check for model loading (503) or unsupported format
+                    if response.status_code == 503:
+                        logger.warning(f"⚠️ Model {model} is loading, trying next...")
+                        continue
+                    
+                    if response.status_code == 400:
+                        error_detail = response.text
+                        logger.warning(f"⚠️ Model {model} rejected audio: {error_detail[:100]}")
+                        continue
                         
-                        transcript = result.get("text", "")
-                        if transcript:
-                            logger.info(f"🎤 STT (HuggingFace/{model}): '{transcript[:50]}...'")
-                            return transcript
-                        else:
-                            logger.warning(f"⚠️ Model {model} returned empty transcription")
-                            continue
+                    response.raise_for_status()
+                    result = response.json()
                     
+                    transcript = result.get("text", "")
+                    if transcript:
+                        logger.info(f"🎤 STT (HuggingFace/{model}): '{transcript[:50]}...'")
+                        return transcript
+                    else:
+                        logger.warning(f"⚠️ Model {model} returned empty transcription")
+                        continue
+                
                 except Exception as e:
                     logger.warning(f"⚠️ HF model {model} failed: {e}")
                     last_error = e
@@ -195,12 +236,7 @@ class VoiceService:
         # 1. Try OpenAI first (best quality)
         if self.client:
             try:
-                response = self.client.audio.speech.create(
-                    model=model,
-                    voice=voice,
-                    input=clean_text
-                )
-                audio_bytes = response.content
+                audio_bytes = await self._openai_speech(clean_text, voice, model)
                 logger.info(f"🔊 TTS (OpenAI): Generated {len(audio_bytes)} bytes")
                 return audio_bytes, "audio/mpeg"
                 
@@ -6,6 +6,14 @@ from typing import Any, Dict, List
 import os
 import json
 
+# orjson serializes large tool payloads (e.g. event lists) in C; fall back to
+# the stdlib encoder when it isn't installed
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
+
 
 class BaseMCPServer:
     """Base class for MCP servers"""
@@ -13,7 +21,11 @@ class BaseMCPServer:
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
-        self.app = FastAPI(title=name, description=description)
+        self.app = FastAPI(
+            title=name,
+            description=description,
+            default_response_class=DefaultResponse
+        )
         
         # Parse allowed origins from env or default to permissive for local dev
         allowed_origins_env = os.environ.get("ALLOWED_ORIGINS", '["*"]')
@@ -1,6 +1,7 @@
 """Calendar server config"""
 
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
@@ -19,11 +20,18 @@ class CalendarSettings(BaseSettings):
     # API Keys
     CALENDAR_API_KEY: Optional[str] = None
 
-    model_config = {
-        "env_file": ".env",
-        "case_sensitive": True,
-        "extra": "ignore"
-    }
+    # Worker threads reserved for blocking Google API calls
+    GCAL_MAX_WORKERS: int = 16
 
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True,
+    )
 
-calendar_settings = CalendarSettings()
+
+@lru_cache(maxsize=1)
+def get_calendar_settings() -> CalendarSettings:
+    """Return the process-wide settings, parsing the environment and .env only once"""
+    return CalendarSettings()
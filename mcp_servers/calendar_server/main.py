@@ -2,11 +2,18 @@
 
 
 import asyncio
+import logging
 import os
 import json
-from typing import Any, Dict, List
-from datetime import datetime, timedelta
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+import httpx
+from datetime import datetime, timedelta, timezone
+from html import escape
+from string import Template
 from mcp_servers.base_server import BaseMCPServer
+from mcp_servers.oauth_flows import PendingOAuthFlows
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import HTMLResponse
 
@@ -16,8 +23,195 @@ from google_auth_oauthlib.flow import Flow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from google.auth.transport.requests import Request
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
-from mcp_servers.calendar_server.config import calendar_settings
+from mcp_servers.calendar_server.config import get_calendar_settings
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
+
+# Max sub-requests packed into one Google batch HTTP request
+CALENDAR_BATCH_LIMIT = 50
+
+# Dedicated pool so Calendar calls don't queue behind other work on the default
+# executor. Created on first use so importing this module doesn't read settings.
+_GCAL_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _gcal_pool() -> ThreadPoolExecutor:
+    global _GCAL_POOL
+    if _GCAL_POOL is None:
+        _GCAL_POOL = ThreadPoolExecutor(
+            max_workers=get_calendar_settings().GCAL_MAX_WORKERS,
+            thread_name_prefix="gcal"
+        )
+    return _GCAL_POOL
+
+
+async def _run(fn, *args):
+    """Run a blocking Google API call on the Calendar thread pool"""
+    return await asyncio.get_running_loop().run_in_executor(_gcal_pool(), fn, *args)
+
+
+# ── Retry policy for transient Google API failures (429 / 5xx) ──
+
+_GOOGLE_MAX_ATTEMPTS = 3
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _is_transient_google_error(exc: BaseException) -> bool:
+    if isinstance(exc, HttpError):
+        return exc.resp.status in _RETRYABLE_STATUSES
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRYABLE_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+def _is_unprocessed_google_error(exc: BaseException) -> bool:
+    """Failures where Google can't have acted on the request: 429 rejections
+    and errors before the connection was made. A 5xx or a timeout on an
+    insert may come after the event was created, so those aren't retried."""
+    if isinstance(exc, HttpError):
+        return exc.resp.status == 429
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429
+    return isinstance(exc, (ConnectionRefusedError, socket.gaierror, httpx.ConnectError, httpx.ConnectTimeout))
+
+
+def _log_retry(retry_state) -> None:
+    logger.warning(
+        "Google Calendar API call failed (attempt %d/%d), retrying: %s",
+        retry_state.attempt_number,
+        _GOOGLE_MAX_ATTEMPTS,
+        retry_state.outcome.exception()
+    )
+
+
+google_retry = retry(
+    wait=wait_exponential_jitter(initial=0.5, max=8),
+    stop=stop_after_attempt(_GOOGLE_MAX_ATTEMPTS),
+    retry=retry_if_exception(_is_transient_google_error),
+    before_sleep=_log_retry,
+    reraise=True
+)
+
+# For non-idempotent calls (events.insert)
+google_insert_retry = retry(
+    wait=wait_exponential_jitter(initial=0.5, max=8),
+    stop=stop_after_attempt(_GOOGLE_MAX_ATTEMPTS),
+    retry=retry_if_exception(_is_unprocessed_google_error),
+    before_sleep=_log_retry,
+    reraise=True
+)
+
+
+@google_retry
+async def _call_api(fn, *args):
+    """Run a blocking, idempotent Google API call on the pool, retrying transient failures"""
+    return await _run(fn, *args)
+
+
+@google_insert_retry
+async def _call_api_once(fn, *args):
+    """Run a blocking Google API call with side effects; only retried when it never reached Google"""
+    return await _run(fn, *args)
+
+
+# ── OAuth HTML pages (built once at import; only the dynamic slots vary) ──
+
+_AUTH_OK_HTML = """
+<html>
+    <body style="text-align: center; padding: 50px; font-family: Arial;">
+        <h1 style="color: green;">✓ Authorization Successful</h1>
+        <p>Google Calendar is now connected.</p>
+        <p>You can close this window and return to your application.</p>
+    </body>
+</html>
+""".encode()
+
+_MISSING_CREDS_HTML = """
+<html>
+    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
+        <h1>✗ Missing OAuth Credentials</h1>
+        <p>GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET must be set in environment variables.</p>
+    </body>
+</html>
+""".encode()
+
+_AUTH_DENIED_TPL = Template("""
+<html>
+    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
+        <h1>✗ Authorization Denied</h1>
+        <p>Error: $error</p>
+    </body>
+</html>
+""")
+
+_AUTH_FAILED_TPL = Template("""
+<html>
+    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
+        <h1>✗ Authorization Failed</h1>
+        <p>Error: $error</p>
+        <p>Please try again.</p>
+    </body>
+</html>
+""")
+
+_AUTH_ERROR_TPL = Template("""
+<html>
+    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
+        <h1>✗ Authorization Error</h1>
+        <p>Error: $error</p>
+        <p>Make sure credentials.json exists in the calendar_server directory.</p>
+    </body>
+</html>
+""")
+
+_AUTH_PAGE_TPL = Template("""
+<html>
+    <head>
+        <style>
+            body {
+                font-family: Arial, sans-serif;
+                max-width: 600px;
+                margin: 50px auto;
+                padding: 20px;
+                background: #f5f5f5;
+            }
+            .container {
+                background: white;
+                padding: 30px;
+                border-radius: 8px;
+                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            }
+            h1 {
+                color: #1f2937;
+            }
+            .auth-link {
+                display: inline-block;
+                padding: 12px 24px;
+                background: #4285f4;
+                color: white;
+                text-decoration: none;
+                border-radius: 4px;
+                margin-top: 20px;
+            }
+            .auth-link:hover {
+                background: #357ae8;
+            }
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <h1>🔐 Google Calendar Authorization</h1>
+            <p>Click the button below to authorize access to your Google Calendar:</p>
+            <a href="$auth_url" class="auth-link">Authorize with Google</a>
+            <p style="margin-top: 20px; color: #666;">You will be redirected back after authorization.</p>
+        </div>
+    </body>
+</html>
+""")
 
 
 class CalendarMCPServer(BaseMCPServer):
@@ -32,8 +226,28 @@ class CalendarMCPServer(BaseMCPServer):
         self._scopes = ["https://www.googleapis.com/auth/calendar"]
         self._token_path = os.path.join(os.path.dirname(__file__), "token.json")
         self._creds_path = os.path.join(os.path.dirname(__file__), "credentials.json")
-        self._auth_flow = None  # Store flow for callback
-        self._auth_state = None  # Store state for callback
+        self._pending_flows = PendingOAuthFlows()  # OAuth flows awaiting /callback, keyed by state
+        self._cached_creds = None  # Parsed token.json, reused until the file changes
+        self._cached_creds_mtime = 0.0
+        self._auth_request = Request()  # Reused so token refreshes share one HTTP session
+        self._logged_auth_state = None  # Log the OAuth URL once, not on every pending-auth poll
+        self._http = None  # Lazily created httpx.AsyncClient (keep-alive pool for REST calls)
+
+        @self.app.on_event("startup")
+        async def preload_calendar_service():
+            # Load token.json and build the service once at boot so the first
+            # tool call doesn't pay the cold-start cost
+            if os.path.exists(self._token_path):
+                try:
+                    await self._get_calendar_service()
+                except Exception as exc:
+                    logger.warning("Could not preload Google Calendar credentials: %s", exc)
+
+        @self.app.on_event("shutdown")
+        async def close_http_client():
+            if self._http is not None:
+                await self._http.aclose()
+                self._http = None
         
         # Build client config from environment variables
         self._client_config = {
@@ -51,54 +265,29 @@ class CalendarMCPServer(BaseMCPServer):
         async def oauth_callback(code: str = None, state: str = None, error: str = None):
             """Handle OAuth callback from Google"""
             if error:
-                return HTMLResponse(f"""
-                <html>
-                    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
-                        <h1>✗ Authorization Denied</h1>
-                        <p>Error: {error}</p>
-                    </body>
-                </html>
-                """)
+                return HTMLResponse(_AUTH_DENIED_TPL.substitute(error=escape(error)))
             
             if not code:
                 raise HTTPException(status_code=400, detail="Missing authorization code")
             
-            if not self._auth_flow:
-                raise HTTPException(status_code=400, detail="No pending authorization flow")
+            flow = self._pending_flows.pop(state)
+            if flow is None:
+                raise HTTPException(status_code=400, detail="No pending authorization flow for this state")
             
             try:
                 # Exchange code for token
-                self._auth_flow.fetch_token(code=code)
-                creds = self._auth_flow.credentials
+                flow.fetch_token(code=code)
+                creds = flow.credentials
                 
-                # Save token to file
-                with open(self._token_path, "w") as token_file:
-                    token_file.write(creds.to_json())
+                # Save token to file (off the event loop) and keep it cached
+                await _run(self._save_token, creds)
                 
                 # Reset service to force reload with new credentials
                 self.service = None
-                self._auth_flow = None
-                self._auth_state = None
                 
-                return HTMLResponse("""
-                <html>
-                    <body style="text-align: center; padding: 50px; font-family: Arial;">
-                        <h1 style="color: green;">✓ Authorization Successful</h1>
-                        <p>Google Calendar is now connected.</p>
-                        <p>You can close this window and return to your application.</p>
-                    </body>
-                </html>
-                """)
+                return HTMLResponse(_AUTH_OK_HTML)
             except Exception as e:
-                return HTMLResponse(f"""
-                <html>
-                    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
-                        <h1>✗ Authorization Failed</h1>
-                        <p>Error: {str(e)}</p>
-                        <p>Please try again.</p>
-                    </body>
-                </html>
-                """)
+                return HTMLResponse(_AUTH_FAILED_TPL.substitute(error=escape(str(e))))
         
         # Register OAuth login endpoint
         @self.app.get("/auth")
@@ -113,14 +302,7 @@ class CalendarMCPServer(BaseMCPServer):
                 
                 # Check if credentials are configured
                 if not self._client_config["web"]["client_id"] or not self._client_config["web"]["client_secret"]:
-                    return HTMLResponse("""
-                    <html>
-                        <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
-                            <h1>✗ Missing OAuth Credentials</h1>
-                            <p>GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET must be set in environment variables.</p>
-                        </body>
-                    </html>
-                    """)
+                    return HTMLResponse(_MISSING_CREDS_HTML)
                 
                 flow = Flow.from_client_config(
                     self._client_config,
@@ -131,63 +313,11 @@ class CalendarMCPServer(BaseMCPServer):
                 auth_url, state = flow.authorization_url(prompt='consent')
                 
                 # Store flow for later use in callback
-                self._auth_flow = flow
-                self._auth_state = state
+                self._pending_flows.add(state, flow)
                 
-                return HTMLResponse(f"""
-                <html>
-                    <head>
-                        <style>
-                            body {{
-                                font-family: Arial, sans-serif;
-                                max-width: 600px;
-                                margin: 50px auto;
-                                padding: 20px;
-                                background: #f5f5f5;
-                            }}
-                            .container {{
-                                background: white;
-                                padding: 30px;
-                                border-radius: 8px;
-                                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                            }}
-                            h1 {{
-                                color: #1f2937;
-                            }}
-                            .auth-link {{
-                                display: inline-block;
-                                padding: 12px 24px;
-                                background: #4285f4;
-                                color: white;
-                                text-decoration: none;
-                                border-radius: 4px;
-                                margin-top: 20px;
-                            }}
-                            .auth-link:hover {{
-                                background: #357ae8;
-                            }}
-                        </style>
-                    </head>
-                    <body>
-                        <div class="container">
-                            <h1>🔐 Google Calendar Authorization</h1>
-                            <p>Click the button below to authorize access to your Google Calendar:</p>
-                            <a href="{auth_url}" class="auth-link">Authorize with Google</a>
-                            <p style="margin-top: 20px; color: #666;">You will be redirected back after authorization.</p>
-                        </div>
-                    </body>
-                </html>
-                """)
+                return HTMLResponse(_AUTH_PAGE_TPL.substitute(auth_url=escape(auth_url)))
             except Exception as e:
-                return HTMLResponse(f"""
-                <html>
-                    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
-                        <h1>✗ Authorization Error</h1>
-                        <p>Error: {str(e)}</p>
-                        <p>Make sure credentials.json exists in the calendar_server directory.</p>
-                    </body>
-                </html>
-                """)
+                return HTMLResponse(_AUTH_ERROR_TPL.substitute(error=escape(str(e))))
 
     def get_available_tools(self) -> List[Dict[str, Any]]:
         """Return available calendar tools"""
@@ -215,6 +345,13 @@ class CalendarMCPServer(BaseMCPServer):
                 "params": {
                     "event_id": {"type": "string", "required": True}
                 }
+            },
+            {
+                "name": "delete_events_bulk",
+                "description": "Delete several calendar events in one batch request",
+                "params": {
+                    "event_ids": {"type": "list[string]", "required": True}
+                }
             }
         ]
 
@@ -226,15 +363,27 @@ class CalendarMCPServer(BaseMCPServer):
             return await self._create_event(params)
         elif tool_name == "delete_event":
             return await self._delete_event(params)
+        elif tool_name == "delete_events_bulk":
+            return await self._delete_events_bulk(params)
         else:
             raise ValueError(f"Unknown tool: {tool_name}")
 
+    async def _get_credentials(self):
+        """Return valid OAuth credentials, or None while authorization is pending"""
+        return await _run(self._load_credentials)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled async HTTP client used for direct REST calls"""
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=10.0)
+        return self._http
+
     async def _get_calendar_service(self):
         """Return an authenticated Google Calendar service instance"""
         if self.service is not None:
             return self.service
 
-        service = await asyncio.to_thread(self._build_calendar_service)
+        service = await _run(self._build_calendar_service)
         if service is None:
             # OAuth is pending - return None so caller can handle
             return None
@@ -248,14 +397,33 @@ class CalendarMCPServer(BaseMCPServer):
             return None
         return build("calendar", "v3", credentials=creds, cache_discovery=False)
 
+    def _save_token(self, creds) -> None:
+        """Persist credentials to token.json"""
+        with open(self._token_path, "w") as token_file:
+            token_file.write(creds.to_json())
+        # Seed the cache so the next load doesn't re-parse the file we just wrote
+        self._cached_creds = creds
+        self._cached_creds_mtime = os.path.getmtime(self._token_path)
+
     def _load_credentials(self):
         """Load OAuth credentials or trigger flow if needed"""
         creds = None
-        if os.path.exists(self._token_path):
-            creds = Credentials.from_authorized_user_file(self._token_path, self._scopes)
+        try:
+            mtime = os.path.getmtime(self._token_path)
+        except OSError:
+            mtime = None
+
+        if mtime is not None:
+            if self._cached_creds is not None and mtime == self._cached_creds_mtime:
+                creds = self._cached_creds
+            else:
+                creds = Credentials.from_authorized_user_file(self._token_path, self._scopes)
+                self._cached_creds = creds
+                self._cached_creds_mtime = mtime
 
         if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+            # Refreshes in place, so the cached object stays current
+            creds.refresh(self._auth_request)
 
         if not creds or not creds.valid:
             if not os.path.exists(self._creds_path):
@@ -263,6 +431,10 @@ class CalendarMCPServer(BaseMCPServer):
                     "Missing credentials.json. Provide Google OAuth credentials in mcp_servers/calendar_server/credentials.json."
                 )
             
+            # The URL we already logged is still valid - don't mint another flow per poll
+            if self._logged_auth_state in self._pending_flows:
+                return None
+
             # Create Flow for web-based OAuth
             flow = Flow.from_client_secrets_file(
                 self._creds_path,
@@ -277,13 +449,9 @@ class CalendarMCPServer(BaseMCPServer):
             )
             
             # Store flow for callback handler
-            self._auth_flow = flow
-            self._auth_state = state
-            
-            print("================ GOOGLE AUTH REQUIRED ================", flush=True)
-            print("Open this URL in your browser to authorize access:", flush=True)
-            print(auth_url, flush=True)
-            print("================ Waiting for OAuth callback ================", flush=True)
+            self._pending_flows.add(state, flow)
+            self._logged_auth_state = state
+            logger.warning("Google auth required - open this URL to authorize access: %s", auth_url)
             
             # Return None to signal OAuth is pending - let the callback handler complete
             # The request will be retried after OAuth succeeds
@@ -293,17 +461,18 @@ class CalendarMCPServer(BaseMCPServer):
 
     def _serialize_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """Return simplified event payload for the host"""
-        start = event.get("start", {})
-        end = event.get("end", {})
+        get = event.get
+        start = get("start") or {}
+        end = get("end") or {}
         return {
-            "id": event.get("id"),
-            "title": event.get("summary"),
-            "description": event.get("description", ""),
+            "id": get("id"),
+            "title": get("summary"),
+            "description": get("description", ""),
             "start": start.get("dateTime") or start.get("date"),
             "end": end.get("dateTime") or end.get("date"),
-            "location": event.get("location"),
-            "attendees": [att.get("email") for att in event.get("attendees", []) if att.get("email")],
-            "htmlLink": event.get("htmlLink"),
+            "location": get("location"),
+            "attendees": [email for att in get("attendees") or () if (email := att.get("email"))],
+            "htmlLink": get("htmlLink"),
         }
 
     async def _get_events(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -315,27 +484,37 @@ class CalendarMCPServer(BaseMCPServer):
             days = 30
 
         try:
-            service = await self._get_calendar_service()
-            if service is None:
+            creds = await self._get_credentials()
+            if creds is None:
                 return {
                     "status": "pending_auth",
                     "message": "Google Calendar authorization pending. Check calendar server logs for OAuth URL."
                 }
             
-            now = datetime.utcnow().isoformat() + "Z"
-            max_time = (datetime.utcnow() + timedelta(days=days)).isoformat() + "Z"
-
-            def fetch():
-                return service.events().list(
-                    calendarId="primary",
-                    timeMin=now,
-                    timeMax=max_time,
-                    singleEvents=True,
-                    orderBy="startTime"
-                ).execute()
-
-            events_result = await asyncio.to_thread(fetch)
-            items = events_result.get("items", [])
+            # One clock read so both window bounds line up
+            now_dt = datetime.now(timezone.utc)
+            now = now_dt.isoformat()
+            max_time = (now_dt + timedelta(days=days)).isoformat()
+
+            # Read-only listing goes straight to the REST API on the event loop,
+            # skipping the httplib2 client and its worker-thread hop
+            @google_retry
+            async def fetch():
+                response = await self._get_http_client().get(
+                    CALENDAR_EVENTS_URL,
+                    params={
+                        "timeMin": now,
+                        "timeMax": max_time,
+                        "singleEvents": "true",
+                        "orderBy": "startTime",
+                    },
+                    headers={"Authorization": f"Bearer {creds.token}"}
+                )
+                response.raise_for_status()
+                return response
+
+            response = await fetch()
+            items = response.json().get("items", [])
             events = [self._serialize_event(item) for item in items]
 
             return {
@@ -344,8 +523,11 @@ class CalendarMCPServer(BaseMCPServer):
                 "count": len(events)
             }
 
-        except HttpError as error:
-            return {"status": "error", "error": f"Google Calendar API error: {error}"}
+        except httpx.HTTPStatusError as error:
+            return {
+                "status": "error",
+                "error": f"Google Calendar API error: {error.response.status_code} {error.response.text}"
+            }
         except Exception as exc:
             return {"status": "error", "error": str(exc)}
 
@@ -376,7 +558,7 @@ class CalendarMCPServer(BaseMCPServer):
                 }
                 return service.events().insert(calendarId="primary", body=event_body).execute()
 
-            created_event = await asyncio.to_thread(create)
+            created_event = await _call_api_once(create)
             return {
                 "status": "success",
                 "message": f"Event '{params['title']}' created in Google Calendar",
@@ -417,7 +599,7 @@ class CalendarMCPServer(BaseMCPServer):
             def delete():
                 service.events().delete(calendarId="primary", eventId=event_id).execute()
 
-            await asyncio.to_thread(delete)
+            await _call_api(delete)
             return {
                 "status": "success",
                 "message": f"Event {event_id} deleted successfully"
@@ -433,6 +615,71 @@ class CalendarMCPServer(BaseMCPServer):
         except Exception as exc:
             return {"status": "error", "error": str(exc)}
 
+    async def _delete_events_bulk(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Delete several events via the Calendar batch endpoint instead of one tool call per event"""
+        event_ids = params.get("event_ids")
+
+        if not event_ids or not isinstance(event_ids, list):
+            return {
+                "status": "error",
+                "error": "event_ids must be a non-empty list of event IDs",
+                "suggestion": "First call get_calendar_events to find the event_ids, then delete them in one call"
+            }
+
+        if any(not eid or eid == "[REQUIRES_ID_FROM_ABOVE]" for eid in event_ids):
+            return {
+                "status": "error",
+                "error": "Invalid or placeholder event_id in event_ids",
+                "suggestion": "Every event_id must be obtained from get_calendar_events results first"
+            }
+
+        # Batch request IDs must be unique
+        event_ids = list(dict.fromkeys(event_ids))
+
+        try:
+            service = await self._get_calendar_service()
+            if service is None:
+                return {
+                    "status": "pending_auth",
+                    "message": "Google Calendar authorization pending. Check calendar server logs for OAuth URL."
+                }
+
+            results: Dict[str, str] = {}
+
+            def collect(request_id, response, exception):
+                if results.get(request_id) == "deleted":
+                    return  # already deleted by an earlier attempt before a retry
+                if exception is None:
+                    results[request_id] = "deleted"
+                elif isinstance(exception, HttpError) and exception.resp.status == 404:
+                    results[request_id] = "not_found"
+                else:
+                    results[request_id] = f"error: {exception}"
+
+            def delete_batches():
+                # One multipart POST to /batch per CALENDAR_BATCH_LIMIT events
+                # instead of one round trip per event. Batches run one after
+                # another: they share the service's httplib2.Http, which isn't
+                # thread-safe.
+                for start in range(0, len(event_ids), CALENDAR_BATCH_LIMIT):
+                    batch = service.new_batch_http_request(callback=collect)
+                    for eid in event_ids[start:start + CALENDAR_BATCH_LIMIT]:
+                        batch.add(service.events().delete(calendarId="primary", eventId=eid), request_id=eid)
+                    batch.execute()
+
+            await _call_api(delete_batches)
+
+            deleted = sum(1 for r in results.values() if r == "deleted")
+            return {
+                "status": "success" if deleted == len(event_ids) else "partial" if deleted else "error",
+                "message": f"Deleted {deleted} of {len(event_ids)} events",
+                "results": results
+            }
+        except HttpError as error:
+            return {"status": "error", "error": f"Google Calendar API error: {error}"}
+        except Exception as exc:
+            return {"status": "error", "error": str(exc)}
+
 
 # Create server instance
 calendar_server = CalendarMCPServer()
@@ -1,6 +1,12 @@
-from pydantic_settings import BaseSettings
+"""Gmail server config"""
+
+import logging
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
 
 class GmailSettings(BaseSettings):
     """Gmail server settings"""
@@ -17,20 +23,24 @@ class GmailSettings(BaseSettings):
     # API Keys
     GMAIL_API_KEY: Optional[str] = None
 
-    model_config = {
-        "env_file": ".env",
-        "case_sensitive": True,
-        "extra": "ignore"
-    }
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore",
+        frozen=True,
+    )
 
     def __init__(self, **data):
         super().__init__(**data)
         # Warn if OAuth credentials not set (don't crash, just warn)
         if not self.GOOGLE_CLIENT_ID or not self.GOOGLE_CLIENT_SECRET:
-            print(
-                "⚠️  WARNING: Google OAuth credentials not fully configured. "
+            logger.warning(
+                "⚠️  Google OAuth credentials not fully configured. "
                 "Gmail features will be limited until GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET are set."
             )
 
 
-gmail_settings = GmailSettings()
+@lru_cache(maxsize=1)
+def get_gmail_settings() -> GmailSettings:
+    """Return the process-wide settings, parsing the environment and .env only once"""
+    return GmailSettings()
@@ -4,22 +4,250 @@ import sys
 import os
 import base64
 import asyncio
+import logging
+import tempfile
+import threading
+import httpx
+from urllib.parse import quote
 from email.mime.text import MIMEText
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from mcp_servers.base_server import BaseMCPServer
-from mcp_servers.gmail_server.config import gmail_settings
-from typing import Any, Dict, List
+from mcp_servers.oauth_flows import PendingOAuthFlows
+from mcp_servers.gmail_server.config import get_gmail_settings
+from typing import Any, Dict, List, Optional
 from datetime import datetime
+from html import escape
+from string import Template
+from fastapi import HTTPException
+from fastapi.responses import HTMLResponse
 
 # Google Gmail API imports
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 from google.auth.transport.requests import Request
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential, wait_random
+
+logger = logging.getLogger(__name__)
+
+GMAIL_API_BASE = "https://gmail.googleapis.com/gmail/v1/users/me"
+GMAIL_MAX_EMAILS = 100  # Upper bound on get_emails' limit
+GMAIL_METADATA_CONCURRENCY = 10  # Metadata GETs in flight at once (Gmail caps per-user concurrency)
+
+
+# ── Retry policy for Gmail rate limits and transient failures ──
+# Gmail's documented backoff: 1s base doubling to a 32s cap, plus jitter
+
+_GMAIL_MAX_RETRIES = 5
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+_RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    """429, or a 403 whose error.errors[].reason is a rate-limit reason"""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    status = exc.response.status_code
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    try:
+        errors = exc.response.json().get("error", {}).get("errors", [])
+    except (ValueError, AttributeError):
+        return False
+    return any(
+        isinstance(err, dict) and err.get("reason") in _RATE_LIMIT_REASONS
+        for err in errors
+    )
+
+
+def _is_retryable_gmail_error(exc: BaseException) -> bool:
+    """Retry policy for idempotent (GET) calls: any transient failure"""
+    if _is_rate_limited(exc):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRYABLE_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+def _is_retryable_gmail_send_error(exc: BaseException) -> bool:
+    """Retry policy for non-idempotent (POST) calls.
+
+    Only failures where Gmail provably didn't act on the request: rate-limit
+    rejections and errors before the request was sent. A 5xx or a read
+    timeout may come after the message went out, so retrying could send it
+    twice.
+    """
+    return _is_rate_limited(exc) or isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout))
+
+
+def _log_retry(retry_state) -> None:
+    logger.warning(
+        "Gmail API call failed (attempt %d/%d), retrying: %s",
+        retry_state.attempt_number,
+        _GMAIL_MAX_RETRIES + 1,
+        retry_state.outcome.exception()
+    )
+
+
+gmail_retry = retry(
+    wait=wait_exponential(multiplier=1, max=32) + wait_random(0, 0.5),
+    stop=stop_after_attempt(_GMAIL_MAX_RETRIES + 1),
+    retry=retry_if_exception(_is_retryable_gmail_error),
+    before_sleep=_log_retry,
+    reraise=True
+)
+
+gmail_send_retry = retry(
+    wait=wait_exponential(multiplier=1, max=32) + wait_random(0, 0.5),
+    stop=stop_after_attempt(_GMAIL_MAX_RETRIES + 1),
+    retry=retry_if_exception(_is_retryable_gmail_send_error),
+    before_sleep=_log_retry,
+    reraise=True
+)
+
+
+# ── OAuth HTML pages (built once at import; only the dynamic slots vary) ──
+
+_AUTH_OK_HTML = """
+<html>
+    <body style="text-align: center; padding: 50px; font-family: Arial;">
+        <h1 style="color: green;">✓ Authorization Successful</h1>
+        <p>Gmail is now connected.</p>
+        <p>You can close this window and return to your application.</p>
+    </body>
+</html>
+""".encode()
+
+_MISSING_CREDS_HTML = """
+<html>
+    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
+        <h1>✗ Missing OAuth Credentials</h1>
+        <p>GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET must be set in environment variables.</p>
+    </body>
+</html>
+""".encode()
+
+_AUTH_DENIED_TPL = Template("""
+<html>
+    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
+        <h1>✗ Authorization Denied</h1>
+        <p>Error: $error</p>
+    </body>
+</html>
+""")
+
+_AUTH_FAILED_TPL = Template("""
+<html>
+    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
+        <h1>✗ Authorization Failed</h1>
+        <p>Error: $error</p>
+        <p>Please try again.</p>
+    </body>
+</html>
+""")
+
+_AUTH_PAGE_TPL = Template("""
+<html>
+    <head>
+        <title>Gmail Authorization</title>
+    </head>
+    <body style="text-align: center; padding: 50px; font-family: Arial;">
+        <h1>Gmail Authorization</h1>
+        <p>Click the button below to authorize Gmail access</p>
+        <a href="$auth_url" style="
+            display: inline-block;
+            padding: 15px 30px;
+            background-color: #4285f4;
+            color: white;
+            text-decoration: none;
+            border-radius: 5px;
+            font-size: 16px;
+            margin-top: 20px;
+        ">Authorize with Google</a>
+    </body>
+</html>
+""")
+
+
+def _iter_text_parts(payload: Dict[str, Any]):
+    """Yield (mimeType, base64url data) for every leaf part, depth-first.
+
+    Handles nested multiparts (e.g. multipart/alternative inside
+    multipart/mixed) that a single-level scan of payload["parts"] misses.
+    """
+    parts = payload.get("parts")
+    if not parts:
+        yield payload.get("mimeType", ""), payload.get("body", {}).get("data", "")
+        return
+    for part in parts:
+        yield from _iter_text_parts(part)
+
+
+def _extract_plain_body(payload: Dict[str, Any]) -> str:
+    """Decode the first text/plain part; fall back to a single-part body."""
+    data = next(
+        (data for mime, data in _iter_text_parts(payload) if mime == "text/plain" and data),
+        None,
+    )
+    if data is None and not payload.get("parts"):
+        data = payload.get("body", {}).get("data", "")
+    if not data:
+        return ""
+    # Only the chosen part is decoded; explicit utf-8 avoids locale guessing
+    return base64.urlsafe_b64decode(data).decode("utf-8", errors="replace")
+
+
+# RFC 5322 hard limit on line length, excluding the CRLF
+_MAX_LINE_BYTES = 998
+
+
+def _is_plain_header(name: str, value: str) -> bool:
+    """ASCII, single-line, and short enough to send unfolded"""
+    return (
+        value.isascii()
+        and "\r" not in value
+        and "\n" not in value
+        and len(name) + 2 + len(value) <= _MAX_LINE_BYTES
+    )
+
+
+def _build_raw_message(to: str, subject: str, body: str, cc: str = "", bcc: str = "") -> bytes:
+    """Compose a text/plain RFC 5322 message.
+
+    Simple messages (short single-line ASCII headers, body lines within the
+    998-byte limit) are concatenated directly; anything else goes through
+    MIMEText so headers get folded / RFC 2047-encoded and the body
+    transfer-encoded.
+    """
+    headers = [("To", to), ("Subject", subject)]
+    if cc:
+        headers.append(("Cc", cc))
+    if bcc:
+        headers.append(("Bcc", bcc))
+
+    # Only LF / CRLF end a line; str.splitlines() would also break on \f, \v,
+    # \x1c-\x1e, \x85, \u2028 and \u2029 and silently turn them into CRLF
+    body_lines = [line[:-1] if line.endswith("\r") else line for line in body.split("\n")]
+    if all(_is_plain_header(n, v) for n, v in headers) and all(
+        len(line.encode("utf-8")) <= _MAX_LINE_BYTES for line in body_lines
+    ):
+        head = "".join(f"{name}: {value}\r\n" for name, value in headers)
+        return (
+            head
+            + "MIME-Version: 1.0\r\n"
+            + "Content-Type: text/plain; charset=utf-8\r\n"
+            + "Content-Transfer-Encoding: 8bit\r\n\r\n"
+            + "\r\n".join(body_lines)
+        ).encode("utf-8")
+
+    message = MIMEText("\n".join(body_lines), "plain", "utf-8")
+    for name, value in headers:
+        message[name] = value
+    return message.as_bytes()
 
 
 class GmailMCPServer(BaseMCPServer):
@@ -30,12 +258,17 @@ class GmailMCPServer(BaseMCPServer):
             name="Gmail Server",
             description="Gmail integration via MCP"
         )
-        self.service = None  # Gmail service (placeholder)
         self._scopes = ["https://www.googleapis.com/auth/gmail.send", "https://www.googleapis.com/auth/gmail.readonly"]
         self._token_path = os.path.join(os.path.dirname(__file__), "token.json")
         self._creds_path = os.path.join(os.path.dirname(__file__), "credentials.json")
-        self._auth_flow = None
-        self._auth_state = None
+        self._pending_flows = PendingOAuthFlows()  # OAuth flows awaiting /callback, keyed by state
+        self._http = None  # Lazily created httpx.AsyncClient (keep-alive pool for REST calls)
+        self._creds: Optional[Credentials] = None  # Loaded once, refreshed in place
+        self._creds_lock = asyncio.Lock()
+        self._auth_request = Request()  # Reused so token refreshes share one HTTP session
+        self._logged_auth_state = None  # Log the OAuth URL once, not on every pending-auth poll
+        self._background_tasks = set()  # Strong refs to fire-and-forget token writes
+        self._token_write_lock = threading.Lock()  # Token writes run on worker threads
         
         # Build client config from environment variables
         self._client_config = {
@@ -48,6 +281,23 @@ class GmailMCPServer(BaseMCPServer):
             }
         }
         
+        @self.app.on_event("startup")
+        async def preload_credentials():
+            # Validate config at boot (warns if OAuth client credentials are missing)
+            get_gmail_settings()
+            # Parse token.json once at boot so the first tool call doesn't pay for it
+            if os.path.exists(self._token_path):
+                try:
+                    await self._get_credentials()
+                except Exception as exc:
+                    logger.warning("Could not preload Gmail credentials: %s", exc)
+
+        @self.app.on_event("shutdown")
+        async def close_http_client():
+            if self._http is not None:
+                await self._http.aclose()
+                self._http = None
+        
         # Register OAuth authorization endpoint
         @self.app.get("/auth")
         async def auth_endpoint(redirect_uri: str = None):
@@ -55,18 +305,9 @@ class GmailMCPServer(BaseMCPServer):
             Args:
                 redirect_uri: OAuth callback URI (defaults to http://localhost:8002/callback for local dev)
             """
-            from fastapi.responses import HTMLResponse
-            
             # Check if credentials are configured
             if not self._client_config["web"]["client_id"] or not self._client_config["web"]["client_secret"]:
-                return HTMLResponse("""
-                <html>
-                    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
-                        <h1>✗ Missing OAuth Credentials</h1>
-                        <p>GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET must be set in environment variables.</p>
-                    </body>
-                </html>
-                """)
+                return HTMLResponse(_MISSING_CREDS_HTML)
             
             # Use provided redirect_uri or default to localhost for development
             oauth_redirect = redirect_uri or "http://localhost:8002/callback"
@@ -85,87 +326,36 @@ class GmailMCPServer(BaseMCPServer):
             )
             
             # Store flow for callback handler
-            self._auth_flow = flow
-            self._auth_state = state
+            self._pending_flows.add(state, flow)
             
-            return HTMLResponse(f"""
-            <html>
-                <head>
-                    <title>Gmail Authorization</title>
-                </head>
-                <body style="text-align: center; padding: 50px; font-family: Arial;">
-                    <h1>Gmail Authorization</h1>
-                    <p>Click the button below to authorize Gmail access</p>
-                    <a href="{auth_url}" style="
-                        display: inline-block;
-                        padding: 15px 30px;
-                        background-color: #4285f4;
-                        color: white;
-                        text-decoration: none;
-                        border-radius: 5px;
-                        font-size: 16px;
-                        margin-top: 20px;
-                    ">Authorize with Google</a>
-                </body>
-            </html>
-            """)
+            return HTMLResponse(_AUTH_PAGE_TPL.substitute(auth_url=escape(auth_url)))
         
         # Register OAuth callback endpoint
         @self.app.get("/callback")
         async def oauth_callback(code: str = None, state: str = None, error: str = None):
             """Handle OAuth callback from Google"""
-            from fastapi import HTTPException
-            from fastapi.responses import HTMLResponse
-            
             if error:
-                return HTMLResponse(f"""
-                <html>
-                    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
-                        <h1>✗ Authorization Denied</h1>
-                        <p>Error: {error}</p>
-                    </body>
-                </html>
-                """)
+                return HTMLResponse(_AUTH_DENIED_TPL.substitute(error=escape(error)))
             
             if not code:
                 raise HTTPException(status_code=400, detail="Missing authorization code")
             
-            if not self._auth_flow:
-                raise HTTPException(status_code=400, detail="No pending authorization flow")
+            flow = self._pending_flows.pop(state)
+            if flow is None:
+                raise HTTPException(status_code=400, detail="No pending authorization flow for this state")
             
             try:
                 # Exchange code for token
-                self._auth_flow.fetch_token(code=code)
-                creds = self._auth_flow.credentials
+                flow.fetch_token(code=code)
+                creds = flow.credentials
                 
-                # Save token to file
-                with open(self._token_path, "w") as token_file:
-                    token_file.write(creds.to_json())
+                # Keep the token in memory for the next tool call; persist it in the background
+                self._creds = creds
+                self._persist_token(creds)
                 
-                # Reset service to force reload with new credentials
-                self.service = None
-                self._auth_flow = None
-                self._auth_state = None
-                
-                return HTMLResponse("""
-                <html>
-                    <body style="text-align: center; padding: 50px; font-family: Arial;">
-                        <h1 style="color: green;">✓ Authorization Successful</h1>
-                        <p>Gmail is now connected.</p>
-                        <p>You can close this window and return to your application.</p>
-                    </body>
-                </html>
-                """)
+                return HTMLResponse(_AUTH_OK_HTML)
             except Exception as e:
-                return HTMLResponse(f"""
-                <html>
-                    <body style="text-align: center; padding: 50px; font-family: Arial; color: red;">
-                        <h1>✗ Authorization Failed</h1>
-                        <p>Error: {str(e)}</p>
-                        <p>Please try again.</p>
-                    </body>
-                </html>
-                """)
+                return HTMLResponse(_AUTH_FAILED_TPL.substitute(error=escape(str(e))))
 
     def get_available_tools(self) -> List[Dict[str, Any]]:
         """Return available Gmail tools"""
@@ -198,24 +388,86 @@ class GmailMCPServer(BaseMCPServer):
             }
         ]
 
-    async def _get_gmail_service(self):
-        """Return an authenticated Gmail service instance"""
-        if self.service is not None:
-            return self.service
+    async def _get_credentials(self):
+        """Return valid OAuth credentials, or None while authorization is pending"""
+        creds = self._creds
+        if creds is not None and creds.valid:
+            return creds
 
-        service = await asyncio.to_thread(self._build_gmail_service)
-        if service is None:
-            # OAuth is pending - return None so caller can handle
-            return None
-        self.service = service
-        return service
+        # Serialize loads/refreshes so concurrent tool calls don't race to
+        # refresh the same token
+        async with self._creds_lock:
+            creds = self._creds
+            if creds is not None and creds.valid:
+                return creds
 
-    def _build_gmail_service(self):
-        creds = self._load_credentials()
-        if creds is None:
-            # OAuth is pending, return None to signal we need to wait
-            return None
-        return build("gmail", "v1", credentials=creds, cache_discovery=False)
+            if creds is not None and creds.expired and creds.refresh_token:
+                await asyncio.to_thread(creds.refresh, self._auth_request)
+                self._persist_token(creds)
+                return creds
+
+            creds = await asyncio.to_thread(self._load_credentials)
+            self._creds = creds
+            return creds
+
+    def _save_token(self, creds) -> None:
+        """Persist credentials to token.json.
+
+        Writes are serialized and go through a temp file that is renamed into
+        place, so a concurrent reader never sees a truncated or mixed file.
+        """
+        token_dir = os.path.dirname(self._token_path)
+        with self._token_write_lock:
+            fd, tmp_path = tempfile.mkstemp(dir=token_dir, prefix=".token-", suffix=".json")
+            try:
+                with os.fdopen(fd, "w") as token_file:
+                    token_file.write(creds.to_json())
+                os.replace(tmp_path, self._token_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    def _persist_token(self, creds) -> None:
+        """Write token.json off the event loop without making the caller wait"""
+        task = asyncio.create_task(asyncio.to_thread(self._save_token, creds))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled async HTTP client used for Gmail REST calls"""
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=30.0)
+        return self._http
+
+    async def _api(
+        self, method: str, path: str, creds, idempotent: bool = True, **kwargs
+    ) -> Dict[str, Any]:
+        """Call a Gmail REST endpoint under users/me and return the decoded JSON.
+
+        Pass idempotent=False for calls with side effects (messages/send);
+        they are only retried when Gmail can't have acted on them.
+        """
+        if idempotent:
+            return await self._request_idempotent(method, path, creds, **kwargs)
+        return await self._request_non_idempotent(method, path, creds, **kwargs)
+
+    @gmail_retry
+    async def _request_idempotent(self, method: str, path: str, creds, **kwargs) -> Dict[str, Any]:
+        return await self._request(method, path, creds, **kwargs)
+
+    @gmail_send_retry
+    async def _request_non_idempotent(self, method: str, path: str, creds, **kwargs) -> Dict[str, Any]:
+        return await self._request(method, path, creds, **kwargs)
+
+    async def _request(self, method: str, path: str, creds, **kwargs) -> Dict[str, Any]:
+        response = await self._get_http_client().request(
+            method,
+            f"{GMAIL_API_BASE}/{path}",
+            headers={"Authorization": f"Bearer {creds.token}"},
+            **kwargs
+        )
+        response.raise_for_status()
+        return response.json()
 
     def _load_credentials(self):
         """Load OAuth credentials or trigger flow if needed"""
@@ -224,7 +476,8 @@ class GmailMCPServer(BaseMCPServer):
             creds = Credentials.from_authorized_user_file(self._token_path, self._scopes)
 
         if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
+            creds.refresh(self._auth_request)
+            self._save_token(creds)
 
         if not creds or not creds.valid:
             if not os.path.exists(self._creds_path):
@@ -232,6 +485,10 @@ class GmailMCPServer(BaseMCPServer):
                     "Missing credentials.json. Provide Google OAuth credentials in mcp_servers/gmail_server/credentials.json."
                 )
             
+            # The URL we already logged is still valid - don't mint another flow per poll
+            if self._logged_auth_state in self._pending_flows:
+                return None
+
             # Create Flow for web-based OAuth
             flow = Flow.from_client_secrets_file(
                 self._creds_path,
@@ -246,13 +503,9 @@ class GmailMCPServer(BaseMCPServer):
             )
             
             # Store flow for callback handler
-            self._auth_flow = flow
-            self._auth_state = state
-            
-            print("================ GMAIL AUTH REQUIRED ================", flush=True)
-            print("Open this URL in your browser to authorize access:", flush=True)
-            print(auth_url, flush=True)
-            print("================ Waiting for OAuth callback ================", flush=True)
+            self._pending_flows.add(state, flow)
+            self._logged_auth_state = state
+            logger.warning("Gmail auth required - open this URL to authorize access: %s", auth_url)
             
             # Return None to signal OAuth is pending
             return None
@@ -272,65 +525,71 @@ class GmailMCPServer(BaseMCPServer):
 
     async def _get_emails(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Get recent emails"""
-        limit = params.get("limit", 10)
+        limit = max(1, min(int(params.get("limit", 10)), GMAIL_MAX_EMAILS))
         query = params.get("query", "")
         
         try:
-            service = await self._get_gmail_service()
-            if service is None:
+            creds = await self._get_credentials()
+            if creds is None:
                 return {
                     "status": "pending_auth",
                     "message": "Gmail authorization pending. Check gmail server logs for OAuth URL."
                 }
             
-            def fetch():
-                return service.users().messages().list(
-                    userId="me",
-                    q=query,
-                    maxResults=limit
-                ).execute()
-            
-            result = await asyncio.to_thread(fetch)
+            result = await self._api("GET", "messages", creds, params={"q": query, "maxResults": limit})
             messages = result.get("messages", [])
             
-            # Fetch full details for each message
+            # Fetch metadata concurrently on the event loop, bounded so a large
+            # limit doesn't trip Gmail's per-user concurrent-request limit
+            msg_ids = list(dict.fromkeys(msg["id"] for msg in messages[:limit]))
+            semaphore = asyncio.Semaphore(GMAIL_METADATA_CONCURRENCY)
+
+            async def fetch_metadata(msg_id: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._api(
+                        "GET",
+                        f"messages/{msg_id}",
+                        creds,
+                        params={"format": "metadata", "metadataHeaders": ["From", "Subject", "Date"]}
+                    )
+
+            results = await asyncio.gather(
+                *[fetch_metadata(msg_id) for msg_id in msg_ids],
+                return_exceptions=True
+            )
+            # Failed lookups are skipped, same as before
+            details = {}
+            for msg_id, detail in zip(msg_ids, results):
+                if isinstance(detail, Exception):
+                    logger.warning("Skipping email %s: metadata fetch failed: %s", msg_id, detail)
+                else:
+                    details[msg_id] = detail
+
             emails = []
-            for msg in messages[:limit]:
-                try:
-                    def get_msg():
-                        return service.users().messages().get(
-                            userId="me",
-                            id=msg["id"],
-                            format="metadata",
-                            metadataHeaders=["From", "Subject", "Date"]
-                        ).execute()
-                    
-                    msg_detail = await asyncio.to_thread(get_msg)
-                    headers = {h["name"]: h["value"] for h in msg_detail["payload"].get("headers", [])}
-                    
-                    emails.append({
-                        "id": msg["id"],
-                        "from": headers.get("From", "Unknown"),
-                        "subject": headers.get("Subject", "(No Subject)"),
-                        "timestamp": headers.get("Date", datetime.utcnow().isoformat())
-                    })
-                except Exception:
+            for msg_id in msg_ids:
+                msg_detail = details.get(msg_id)
+                if msg_detail is None:
                     continue
+                headers = {h["name"]: h["value"] for h in msg_detail["payload"].get("headers", [])}
+                emails.append({
+                    "id": msg_id,
+                    "from": headers.get("From", "Unknown"),
+                    "subject": headers.get("Subject", "(No Subject)"),
+                    "timestamp": headers.get("Date", datetime.utcnow().isoformat())
+                })
             
             return {
                 "status": "success",
                 "emails": emails,
                 "count": len(emails)
             }
-        except HttpError as error:
-            return {"status": "error", "error": f"Gmail API error: {error}"}
+        except httpx.HTTPStatusError as error:
+            return {
+                "status": "error",
+                "error": f"Gmail API error: {error.response.status_code} {error.response.text}"
+            }
         except Exception as exc:
             return {"status": "error", "error": str(exc)}
-        return {
-            "status": "success",
-            "emails": emails[:limit],
-            "count": len(emails)
-        }
 
     async def _send_email(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Send email via Gmail"""
@@ -343,41 +602,37 @@ class GmailMCPServer(BaseMCPServer):
                 }
         
         try:
-            service = await self._get_gmail_service()
-            if service is None:
+            creds = await self._get_credentials()
+            if creds is None:
                 return {
                     "status": "pending_auth",
                     "message": "Gmail authorization pending. Check gmail server logs for OAuth URL."
                 }
             
-            # Build email message
-            message = MIMEText(params.get("body", ""))
-            message["to"] = params.get("to")
-            message["subject"] = params.get("subject")
-            
-            if params.get("cc"):
-                message["cc"] = params.get("cc")
-            if params.get("bcc"):
-                message["bcc"] = params.get("bcc")
-            
-            # Encode for API
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
-            
-            def send():
-                return service.users().messages().send(
-                    userId="me",
-                    body={"raw": raw_message}
-                ).execute()
+            # Build email message and encode for API
+            raw = _build_raw_message(
+                params.get("to"),
+                params.get("subject"),
+                params.get("body", ""),
+                cc=params.get("cc") or "",
+                bcc=params.get("bcc") or "",
+            )
+            raw_message = base64.urlsafe_b64encode(raw).decode("ascii")
             
-            result = await asyncio.to_thread(send)
+            result = await self._api(
+                "POST", "messages/send", creds, idempotent=False, json={"raw": raw_message}
+            )
             return {
                 "status": "success",
                 "message": f"Email sent successfully to {params['to']}",
                 "message_id": result.get("id"),
                 "timestamp": datetime.utcnow().isoformat()
             }
-        except HttpError as error:
-            return {"status": "error", "error": f"Gmail API error: {error}"}
+        except httpx.HTTPStatusError as error:
+            return {
+                "status": "error",
+                "error": f"Gmail API error: {error.response.status_code} {error.response.text}"
+            }
         except Exception as exc:
             return {"status": "error", "error": str(exc)}
 
@@ -391,36 +646,17 @@ class GmailMCPServer(BaseMCPServer):
             }
         
         try:
-            service = await self._get_gmail_service()
-            if service is None:
+            creds = await self._get_credentials()
+            if creds is None:
                 return {
                     "status": "pending_auth",
                     "message": "Gmail authorization pending. Check gmail server logs for OAuth URL."
                 }
             
-            def fetch():
-                return service.users().messages().get(
-                    userId="me",
-                    id=email_id,
-                    format="full"
-                ).execute()
-            
-            msg = await asyncio.to_thread(fetch)
+            msg = await self._api("GET", f"messages/{quote(email_id, safe='')}", creds, params={"format": "full"})
             headers = {h["name"]: h["value"] for h in msg["payload"].get("headers", [])}
             
-            # Extract body
-            body = ""
-            if "parts" in msg["payload"]:
-                for part in msg["payload"]["parts"]:
-                    if part["mimeType"] == "text/plain":
-                        data = part["body"].get("data", "")
-                        if data:
-                            body = base64.urlsafe_b64decode(data).decode()
-                        break
-            else:
-                data = msg["payload"]["body"].get("data", "")
-                if data:
-                    body = base64.urlsafe_b64decode(data).decode()
+            body = _extract_plain_body(msg["payload"])
             
             return {
                 "status": "success",
@@ -433,8 +669,11 @@ class GmailMCPServer(BaseMCPServer):
                     "timestamp": headers.get("Date", datetime.utcnow().isoformat())
                 }
             }
-        except HttpError as error:
-            return {"status": "error", "error": f"Gmail API error: {error}"}
+        except httpx.HTTPStatusError as error:
+            return {
+                "status": "error",
+                "error": f"Gmail API error: {error.response.status_code} {error.response.text}"
+            }
         except Exception as exc:
             return {"status": "error", "error": str(exc)}
 
@@ -0,0 +1,59 @@
+"""
+Pending OAuth flows keyed by their ``state`` parameter.
+
+Each /auth (or pending-auth tool call) registers its Flow under the state it
+generated; /callback may only complete the flow whose state it is handed back.
+Entries expire after ``ttl`` seconds so abandoned authorizations don't pile up.
+"""
+import hmac
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class PendingOAuthFlows:
+    """Thread-safe ``state -> Flow`` map with lazy TTL eviction."""
+
+    def __init__(self, ttl: float = 600.0):
+        self._ttl = ttl
+        self._flows: Dict[str, Tuple[Any, float]] = {}
+        # _load_credentials runs on worker threads, the HTTP handlers on the loop
+        self._lock = threading.Lock()
+
+    def _evict_expired(self, now: float) -> None:
+        for state, (_, created) in list(self._flows.items()):
+            if now - created > self._ttl:
+                del self._flows[state]
+
+    def add(self, state: str, flow: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            self._flows[state] = (flow, now)
+
+    def pop(self, state: Optional[str]) -> Optional[Any]:
+        """Remove and return the flow registered for *state*, or None.
+
+        States are compared with hmac.compare_digest so the lookup time
+        doesn't depend on how much of a guessed state matches.
+        """
+        if not state:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            for pending in list(self._flows):
+                if hmac.compare_digest(pending.encode(), state.encode()):
+                    return self._flows.pop(pending)[0]
+        return None
+
+    def __contains__(self, state: Optional[str]) -> bool:
+        if not state:
+            return False
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            return state in self._flows
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._flows)
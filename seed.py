@@ -4,9 +4,17 @@ import json
 from pathlib import Path
 from mcp_host.config import Settings
 import weaviate
+from weaviate.util import generate_uuid5
 import re
 from typing import List, Dict, Any, Optional, Tuple
 import uuid
+import itertools
+import hashlib
+import sqlite3
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # ── LangChain imports ─────────────────────────────────────────────────────
 from langchain.schema import Document
@@ -14,7 +22,6 @@ from langchain_text_splitters import (
     RecursiveCharacterTextSplitter,
     MarkdownHeaderTextSplitter,
 )
-from langchain_community.document_loaders import DirectoryLoader, TextLoader
 
 # python-docx for heading-aware .docx parsing (LangChain's Docx2txtLoader
 # strips heading structure, so we keep python-docx for that one task)
@@ -26,26 +33,51 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 # ============================================================================
 # EMBEDDINGS — imported from shared module (single source of truth)
 # ============================================================================
-from mcp_host.embeddings import MultiFallbackEmbeddings
+from mcp_host.embeddings import LocalEmbeddings, MultiFallbackEmbeddings
 
 
 # Simple sentence splitter — used ONLY for extractive summaries.
 # All chunking is handled by LangChain splitters.
-def simple_sent_tokenize(text: str) -> List[str]:
-    """Split text into sentences using regex."""
-    sentences = re.split(r'(?<=[.!?])\s+', text.strip())
-    return [s.strip() for s in sentences if s.strip()]
+# Compiled once at import rather than looked up on every call.
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def simple_sent_tokenize(text: str, max_sentences: Optional[int] = None) -> List[str]:
+    """Split text into sentences using regex.
+
+    With *max_sentences*, only the leading sentences are split off and the
+    rest of the text is never scanned.
+    """
+    if max_sentences is None:
+        sentences = _SENT_SPLIT_RE.split(text.strip())
+    else:
+        sentences = _SENT_SPLIT_RE.split(text.strip(), maxsplit=max_sentences)[:max_sentences]
+    # The split consumes the whitespace between sentences and the input is
+    # stripped, so pieces never carry surrounding whitespace; only "" (from
+    # empty input) needs filtering.
+    return [s for s in sentences if s]
 
 # Optional: Try to load spaCy for entity extraction
 try:
     import spacy
-    nlp = spacy.load('en_core_web_sm')
+    # Only NER is used — don't even load the components it doesn't need
+    nlp = spacy.load(
+        'en_core_web_sm',
+        exclude=["tagger", "parser", "lemmatizer", "attribute_ruler"],
+    )
     SPACY_AVAILABLE = True
 except (ImportError, OSError):
     logging.warning("spaCy not available. Entity extraction disabled.")
     nlp = None
     SPACY_AVAILABLE = False
 
+def _entities_from_doc(doc) -> Dict[str, List[str]]:
+    """Group a spaCy Doc's named entities by label (deduplicated, sorted)."""
+    entities = defaultdict(set)
+    for ent in doc.ents:
+        entities[ent.label_].add(ent.text)
+    return {label: sorted(values) for label, values in entities.items()}
+
 def extract_entities(text: str) -> Dict[str, List[str]]:
     """
     Extracts named entities from text using spaCy.
@@ -54,67 +86,167 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
     if nlp is None:
         return {}
     
-    doc = nlp(text)
-    entities = {}
-    for ent in doc.ents:
-        if ent.label_ not in entities:
-            entities[ent.label_] = []
-        entities[ent.label_].append(ent.text)
-    
-    # Deduplicate
-    for label in entities:
-        entities[label] = sorted(list(set(entities[label])))
-        
-    return entities
+    return _entities_from_doc(nlp(text))
 
-def load_documents_from_directory(directory_path: str) -> List[Document]:
+def extract_entities_batch(texts: List[str], batch_size: int = 64) -> List[Dict[str, List[str]]]:
     """
-    Load documents using LangChain DirectoryLoader (for .txt/.md) and
-    custom python-docx loader (for .docx — preserves heading structure).
+    Batched extract_entities(): runs every text through nlp.pipe so spaCy
+    amortizes per-call overhead and can fan out across worker processes.
+    Returns one (possibly empty) entities dict per input text, in order.
+    """
+    if nlp is None:
+        return [{} for _ in texts]
+    return [_entities_from_doc(doc) for doc in _nlp_pipe(texts, batch_size)]
 
-    LangChain handles file discovery, encoding, and Document creation.
+def extract_entity_spans_batch(texts: List[str], batch_size: int = 8) -> List[List[list]]:
+    """
+    Run NER over whole documents and return each one's entities as
+    [start_char, end_char, label, text] lists, in document order, so they
+    can be attributed to chunks by offset instead of re-parsing every chunk.
     """
-    documents = []
-    path = Path(directory_path)
+    if nlp is None:
+        return [[] for _ in texts]
+    return [
+        [[ent.start_char, ent.end_char, ent.label_, ent.text] for ent in doc.ents]
+        for doc in _nlp_pipe(texts, batch_size)
+    ]
 
-    # ── Stage 1: .txt and .md via LangChain DirectoryLoader ────────────
-    for ext, label in [("*.txt", "txt"), ("*.md", "md")]:
-        try:
-            loader = DirectoryLoader(
-                str(path),
-                glob=f"**/{ext}",
-                loader_cls=TextLoader,
-                loader_kwargs={"encoding": "utf-8"},
-                show_progress=False,
-                use_multithreading=True,
-            )
-            text_docs = loader.load()
-            for doc in text_docs:
-                file_source = doc.metadata.get("source", "")
-                suffix = Path(file_source).suffix if file_source else f".{label}"
-                sections = _detect_sections_text(doc.page_content, suffix)
-                doc.metadata.update({"type": label, "sections": sections})
-                documents.append(doc)
-                logging.info(
-                    f"✓ Loaded {Path(file_source).name} "
-                    f"({len(doc.page_content)} chars, {len(sections)} sections) [LangChain DirectoryLoader]"
-                )
-        except Exception as e:
-            logging.warning(f"DirectoryLoader for {ext} failed: {e}")
+def _nlp_pipe(texts: List[str], batch_size: int):
+    # Every worker process re-loads the model, so never spawn more workers
+    # than there are batches; small corpora stay in-process.
+    n_batches = -(-len(texts) // batch_size)
+    n_process = max(1, min((os.cpu_count() or 2) // 2, n_batches))
+    return nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
 
-    # ── Stage 2: .docx via python-docx (heading-aware) ─────────────────
-    for file_path in path.rglob("*.docx"):
-        try:
+_SUPPORTED_SUFFIXES = (".txt", ".md", ".docx")
+
+
+def _load_one(file_path: Path) -> Optional[Document]:
+    """
+    Load a single .txt/.md (raw utf-8) or .docx (python-docx, heading-aware)
+    file with its detected sections. Returns None on failure.
+    """
+    try:
+        if file_path.suffix == ".docx":
             full_text, sections = _detect_sections_docx(file_path)
-            documents.append(Document(
+            logging.info(f"✓ Loaded {file_path.name} ({len(full_text)} chars, {len(sections)} sections)")
+            return Document(
                 page_content=full_text,
                 metadata={"source": str(file_path), "type": "docx", "sections": sections},
-            ))
-            logging.info(f"✓ Loaded {file_path.name} ({len(full_text)} chars, {len(sections)} sections)")
-        except Exception as e:
-            logging.error(f"✗ Failed to load {file_path.name}: {e}")
+            )
+
+        # One read syscall + one decode; no TextIOWrapper line machinery
+        text = file_path.read_bytes().decode("utf-8", errors="replace")
+        sections = _detect_sections_text(text, file_path.suffix)
+        logging.info(
+            f"✓ Loaded {file_path.name} ({len(text)} chars, {len(sections)} sections)"
+        )
+        return Document(
+            page_content=text,
+            metadata={
+                "source": str(file_path),
+                "type": file_path.suffix.lstrip("."),
+                "sections": sections,
+            },
+        )
+    except Exception as e:
+        logging.error(f"✗ Failed to load {file_path.name}: {e}")
+        return None
+
+
+def _load_files(supported_files: List[Path]) -> List[Optional[Document]]:
+    """
+    _load_one() over *supported_files*, in order (None for failures).
+
+    .docx parsing (unzip + XML + heading heuristics) is CPU-bound Python, so
+    with more than one .docx and more than one core those files go to a
+    process pool. Text files are plain disk I/O and stay on a thread pool.
+    """
+    cpus = os.cpu_count() or 1
+    docx_files = [p for p in supported_files if p.suffix == ".docx"]
+    use_processes = cpus > 1 and len(docx_files) > 1
+    thread_files = (
+        [p for p in supported_files if p.suffix != ".docx"]
+        if use_processes else supported_files
+    )
+
+    loaded: Dict[Path, Optional[Document]] = {}
+    # Fork the docx workers before any loader threads exist
+    proc_pool = (
+        ProcessPoolExecutor(max_workers=min(cpus, len(docx_files)))
+        if use_processes else None
+    )
+    try:
+        docx_results = proc_pool.map(_load_one, docx_files) if proc_pool else ()
+        if thread_files:
+            max_workers = min(32, cpus + 4, len(thread_files))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="kb-load") as pool:
+                loaded.update(zip(thread_files, pool.map(_load_one, thread_files)))
+        if proc_pool:
+            loaded.update(zip(docx_files, docx_results))
+    finally:
+        if proc_pool:
+            proc_pool.shutdown()
+
+    return [loaded[p] for p in supported_files]
 
-    logging.info(f"Total: {len(documents)} documents loaded")
+
+# Bump when _load_one / section detection output changes, so cached
+# documents from older parser versions are ignored.
+_DOCUMENT_CACHE_VERSION = 1
+
+
+def _document_cache_key(path: Path) -> str:
+    st = path.stat()
+    return hashlib.sha256(
+        f"{_DOCUMENT_CACHE_VERSION}\0{path.resolve()}\0{st.st_mtime_ns}\0{st.st_size}".encode("utf-8")
+    ).hexdigest()
+
+
+def load_documents_from_directory(directory_path: str, cache_path: str = "") -> List[Document]:
+    """
+    Load .txt/.md as utf-8 text and .docx via python-docx (preserves
+    heading structure), in sorted path order.
+
+    With *cache_path*, each file's loaded text + sections are stored in
+    SQLite keyed by (path, mtime, size); unchanged files skip reading and
+    section detection on the next run.
+    """
+    # One os.walk (scandir under the hood) instead of an rglob per extension;
+    # Path objects are only built for files we actually load. Sorted so the
+    # load (and chunk) order doesn't depend on the filesystem's listing order.
+    # Hidden files and directories (.git, .venv, ...) are skipped, as
+    # DirectoryLoader did by default.
+    supported_files = []
+    for dirpath, dirnames, filenames in os.walk(directory_path):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        supported_files.extend(
+            Path(dirpath, name)
+            for name in filenames
+            if name.endswith(_SUPPORTED_SUFFIXES) and not name.startswith(".")
+        )
+    supported_files.sort()
+
+    if cache_path and supported_files:
+        loaded = _cached_compute(
+            cache_path, "documents", "document",
+            keys=[_document_cache_key(p) for p in supported_files],
+            inputs=supported_files,
+            compute=_load_files,
+            encode=lambda doc: json.dumps(
+                {"page_content": doc.page_content, "metadata": doc.metadata},
+                separators=(",", ":"), ensure_ascii=False,
+            ),
+            decode=lambda blob: Document(**json.loads(blob)),
+            label="Document",
+            cacheable=lambda doc: doc is not None,  # retry failed files next run
+        )
+    else:
+        loaded = _load_files(supported_files)
+    documents = [doc for doc in loaded if doc is not None]
+
+    total_chars = sum(len(d.page_content) for d in documents)
+    logging.info(f"Total: {len(documents)} documents loaded ({total_chars} chars)")
     return documents
 
 
@@ -136,26 +268,61 @@ _md_header_splitter = MarkdownHeaderTextSplitter(
 )
 
 
-def _is_heading_by_heuristic(para) -> bool:
+# Heading patterns, compiled once at import (checked for every paragraph/line)
+_DOCX_NUMBERED_HEADING_RE = re.compile(
+    r'^(?:'
+    r'\d{1,3}(?:\.\d{1,3}){0,3}\.?\s+'
+    r'|[A-Z]\.\s+'
+    r'|[IVXLC]+\.\s+'
+    r'|(?:Chapter|Section|Part|Appendix|Annex|Module|Unit|Phase|Pillar|Pillar\s*\d)'
+    r')',
+    re.IGNORECASE,
+)
+_TEXT_NUMBERED_HEADING_RE = re.compile(
+    r'^(?:'
+    r'\d{1,3}(?:\.\d{1,3}){0,3}\.?\s+'
+    r'|[A-Z]\.\s+'
+    r'|[IVXLC]+\.\s+'
+    r'|(?:Chapter|Section|Part|Appendix|Annex|Module|Unit|Phase)'
+    r')',
+    re.IGNORECASE,
+)
+_NUMBERED_DEPTH_RE = re.compile(r'^(\d{1,3}(?:\.\d{1,3}){0,3})\.?\s+')
+_MD_HEADING_RE = re.compile(r'^#{1,4}\s+')
+
+
+def _paragraph_style_name(para) -> str:
+    return (para.style.name or "") if para.style else ""
+
+
+def _is_heading_by_heuristic(
+    para, text: Optional[str] = None, style: Optional[str] = None
+) -> bool:
     """
     Auto-detect whether a python-docx paragraph is a heading using
     multiple heuristics — works even if the document has no formal
     Heading styles applied.
 
-    Checks (any one is enough):
+    Checks (any one is enough), cheapest first:
       1. Word style name starts with "Heading" or equals "Title" / "Subtitle"
-      2. Entire paragraph is bold and ≤ 120 chars
-      3. Font size ≥ 14 pt and ≤ 120 chars
-      4. Text is ALL CAPS, has ≥ 2 words, and ≤ 120 chars
-      5. Text matches common numbered-heading patterns
+      2. Text is ALL CAPS, has ≥ 2 words, and ≤ 120 chars
+      3. Text matches common numbered-heading patterns
          ("1.", "1.1", "A.", "I.", "Chapter 3", "Section 2", etc.)
+      4. Entire paragraph is bold and ≤ 120 chars
+      5. Font size ≥ 14 pt and ≤ 120 chars
+
+    ``text`` / ``style`` may be passed in when the caller already has them;
+    both are comparatively expensive python-docx property reads. Run
+    formatting (4, 5) is the most expensive of all, so it is read last.
     """
-    text = para.text.strip()
+    if text is None:
+        text = para.text.strip()
     if not text or len(text) > 120:
         return False
 
     # 1. Formal Word style
-    style = (para.style.name or "") if para.style else ""
+    if style is None:
+        style = _paragraph_style_name(para)
     if style.startswith("Heading") or style in ("Title", "Subtitle"):
         return True
 
@@ -163,36 +330,30 @@ def _is_heading_by_heuristic(para) -> bool:
     if word_count < 1 or word_count > 15:
         return False            # Too long for a heading
 
-    # 2. All runs bold
-    runs = [r for r in para.runs if r.text.strip()]
-    if runs and all(r.bold for r in runs):
+    # 2. ALL CAPS with at least 2 words (rules out acronyms like "AI")
+    if word_count >= 2 and text.isupper():
         return True
 
-    # 3. Large font (≥ 14pt)
-    sizes = {r.font.size.pt for r in runs if r.font and r.font.size}
-    if sizes and min(sizes) >= 14:
+    # 3. Numbered heading patterns
+    if _DOCX_NUMBERED_HEADING_RE.match(text):
         return True
 
-    # 4. ALL CAPS with at least 2 words (rules out acronyms like "AI")
-    if text == text.upper() and word_count >= 2 and any(c.isalpha() for c in text):
+    # 4. All runs bold
+    runs = [r for r in para.runs if r.text.strip()]
+    if runs and all(r.bold for r in runs):
         return True
 
-    # 5. Numbered heading patterns
-    if re.match(
-        r'^(?:'
-        r'\d{1,3}(?:\.\d{1,3}){0,3}\.?\s+'
-        r'|[A-Z]\.\s+'
-        r'|[IVXLC]+\.\s+'
-        r'|(?:Chapter|Section|Part|Appendix|Annex|Module|Unit|Phase|Pillar|Pillar\s*\d)'
-        r')'
-        , text, re.IGNORECASE
-    ):
+    # 5. Large font (≥ 14pt)
+    sizes = {r.font.size.pt for r in runs if r.font and r.font.size}
+    if sizes and min(sizes) >= 14:
         return True
 
     return False
 
 
-def _infer_heading_level(para) -> int:
+def _infer_heading_level(
+    para, text: Optional[str] = None, style: Optional[str] = None
+) -> int:
     """
     Infer markdown heading level from a python-docx paragraph.
 
@@ -202,7 +363,8 @@ def _infer_heading_level(para) -> int:
          "1. Topic" → 1, "1.1 Sub" → 2, "1.1.1 Detail" → 3
       3. Everything else (bold, ALL CAPS) → level 1
     """
-    style = (para.style.name or "") if para.style else ""
+    if style is None:
+        style = _paragraph_style_name(para)
     if style == "Title":
         return 1
     if style == "Subtitle":
@@ -214,8 +376,9 @@ def _infer_heading_level(para) -> int:
             return 1
 
     # Infer level from numbered-heading depth: "1." → 1, "1.2" → 2, "1.2.3" → 3
-    text = para.text.strip()
-    m = re.match(r'^(\d{1,3}(?:\.\d{1,3}){0,3})\.?\s+', text)
+    if text is None:
+        text = para.text.strip()
+    m = _NUMBERED_DEPTH_RE.match(text)
     if m:
         depth = m.group(1).count('.') + 1      # "1" → 1, "1.2" → 2, "1.2.3" → 3
         return min(depth, 4)
@@ -236,13 +399,16 @@ def _docx_to_markdown(file_path) -> Tuple[str, str]:
     plain_lines: List[str] = []
 
     for para in doc.paragraphs:
-        text = para.text.strip()
-        if not text:
+        raw = para.text              # joins every run's XML text — read it once
+        if not raw or raw.isspace():
             continue
+        text = raw.strip()
         plain_lines.append(text)
 
-        if _is_heading_by_heuristic(para):
-            level = _infer_heading_level(para)
+        # Headings are ≤ 120 chars, so skip the style lookup for body paragraphs
+        style = _paragraph_style_name(para) if len(text) <= 120 else ""
+        if _is_heading_by_heuristic(para, text, style):
+            level = _infer_heading_level(para, text, style)
             md_lines.append(f"\n{'#' * level} {text}\n")
         else:
             md_lines.append(text)
@@ -276,8 +442,10 @@ def _detect_sections_docx(file_path) -> Tuple[str, List[Dict[str, str]]]:
     if not sections:
         sections.append({"heading": Path(file_path).stem, "text": full_text})
 
-    logging.info(f"  → Detected {len(sections)} sections in {Path(file_path).name}: "
-                 f"{[s['heading'][:50] for s in sections]}")
+    # Per-section heading dump is debug-only; the per-file count is logged by the loader
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(f"  → Detected {len(sections)} sections in {Path(file_path).name}: "
+                      f"{[s['heading'][:50] for s in sections]}")
     return full_text, sections
 
 
@@ -291,7 +459,7 @@ def _is_text_heading(line: str) -> bool:
         return False
 
     # Markdown # heading
-    if re.match(r'^#{1,4}\s+', stripped):
+    if _MD_HEADING_RE.match(stripped):
         return True
 
     word_count = len(stripped.split())
@@ -299,19 +467,11 @@ def _is_text_heading(line: str) -> bool:
         return False
 
     # ALL CAPS (at least 2 words)
-    if stripped == stripped.upper() and word_count >= 2 and any(c.isalpha() for c in stripped):
+    if word_count >= 2 and stripped.isupper():
         return True
 
     # Numbered heading
-    if re.match(
-        r'^(?:'
-        r'\d{1,3}(?:\.\d{1,3}){0,3}\.?\s+'
-        r'|[A-Z]\.\s+'
-        r'|[IVXLC]+\.\s+'
-        r'|(?:Chapter|Section|Part|Appendix|Annex|Module|Unit|Phase)'
-        r')'
-        , stripped, re.IGNORECASE
-    ):
+    if _TEXT_NUMBERED_HEADING_RE.match(stripped):
         return True
 
     return False
@@ -377,20 +537,32 @@ def _detect_sections_text(text: str, file_suffix: str = ".md") -> List[Dict[str,
 # EXTRACTIVE SUMMARIES
 # ============================================================================
 
-def generate_extractive_summary(
-    text: str, max_sentences: int = 3, max_tokens: int = 150
-) -> str:
-    """Create an extractive summary from the first N sentences, capped at max_tokens."""
-    sentences = simple_sent_tokenize(text)
+def _summary_with_token_count(
+    text: str, max_sentences: int, max_tokens: int
+) -> Tuple[str, int]:
+    """generate_extractive_summary() plus the summary's whitespace token count,
+    which is tallied while sentences are picked so callers needn't re-split."""
+    # Only the first max_sentences are ever used — don't split the whole document
+    sentences = simple_sent_tokenize(text, max_sentences=max_sentences)
     parts: List[str] = []
     token_count = 0
-    for sent in sentences[:max_sentences]:
+    for sent in sentences:
         sent_tokens = len(sent.split())
         if token_count + sent_tokens > max_tokens and parts:
             break
         parts.append(sent)
         token_count += sent_tokens
-    return ' '.join(parts) if parts else text[:400]
+    if not parts:
+        fallback = text[:400]
+        return fallback, len(fallback.split())
+    return ' '.join(parts), token_count
+
+
+def generate_extractive_summary(
+    text: str, max_sentences: int = 3, max_tokens: int = 150
+) -> str:
+    """Create an extractive summary from the first N sentences, capped at max_tokens."""
+    return _summary_with_token_count(text, max_sentences, max_tokens)[0]
 
 
 # ============================================================================
@@ -434,14 +606,24 @@ def semantic_hierarchical_chunking(
     )
     all_chunks: List[Document] = []
 
+    # Chunk IDs only need to be unique per run: one uuid4 prefix + a counter
+    # instead of a CSPRNG read per chunk.
+    run_id = uuid.uuid4().hex
+    seq = itertools.count()
+
+    def next_chunk_id() -> str:
+        return f"{run_id}-{next(seq)}"
+
     for doc in documents:
         full_text = doc.page_content
         source = doc.metadata.get("source", "unknown")
         sections = doc.metadata.get("sections", [])
 
         # ── Level 0: Document summary ───────────────────────────────────────
-        doc_summary = generate_extractive_summary(full_text, max_sentences=5, max_tokens=200)
-        doc_chunk_id = str(uuid.uuid4())
+        doc_summary, doc_summary_tokens = _summary_with_token_count(
+            full_text, max_sentences=5, max_tokens=200
+        )
+        doc_chunk_id = next_chunk_id()
         all_chunks.append(Document(
             page_content=doc_summary,
             metadata={
@@ -454,7 +636,7 @@ def semantic_hierarchical_chunking(
                 "chunk_index": 0,
                 "total_chunks": 1,
                 "chunk_size": len(doc_summary),
-                "token_count": len(doc_summary.split()),
+                "token_count": doc_summary_tokens,
             }
         ))
 
@@ -469,12 +651,16 @@ def semantic_hierarchical_chunking(
             if not sec_text:
                 continue
 
-            sec_tokens = len(sec_text.split())
             sec_chars  = len(sec_text)
-            sec_summary = generate_extractive_summary(sec_text, max_sentences=3, max_tokens=120)
-            section_chunk_id = str(uuid.uuid4())
+            sec_summary, sec_summary_tokens = _summary_with_token_count(
+                sec_text, max_sentences=3, max_tokens=120
+            )
+            section_chunk_id = next_chunk_id()
 
-            if sec_chars <= section_max_chars:
+            # A section no longer than sub_chunk_size would come back from the
+            # splitter as a single piece — keep it whole rather than emit a
+            # summary-only L1 plus one L2 duplicating the section.
+            if sec_chars <= section_max_chars or sec_chars <= sub_chunk_size:
                 # Section fits in one chunk → Level 1 (full text)
                 all_chunks.append(Document(
                     page_content=sec_text,
@@ -487,8 +673,8 @@ def semantic_hierarchical_chunking(
                         "parent_id": doc_chunk_id,
                         "chunk_index": sec_idx,
                         "total_chunks": 1,
-                        "chunk_size": len(sec_text),
-                        "token_count": sec_tokens,
+                        "chunk_size": sec_chars,
+                        "token_count": len(sec_text.split()),
                     }
                 ))
             else:
@@ -508,13 +694,14 @@ def semantic_hierarchical_chunking(
                         "chunk_index": sec_idx,
                         "total_chunks": 0,
                         "chunk_size": len(sec_summary),
-                        "token_count": len(sec_summary.split()),
+                        "token_count": sec_summary_tokens,
                     }
                 ))
 
-                # ── Level 2: sub-chunk via LangChain create_documents() ──
-                # create_documents() returns Document objects directly,
-                # propagating the base metadata to every sub-chunk.
+                # ── Level 2: sub-chunk via LangChain split_text() ──
+                # Each sub-chunk's metadata is built as one dict literal —
+                # create_documents() would deep-copy a base dict per chunk
+                # only for us to update() it straight afterwards.
                 if sub_chunk_size == 1024 and sub_chunk_overlap == 256:
                     splitter = _sub_chunk_splitter
                 else:
@@ -526,37 +713,364 @@ def semantic_hierarchical_chunking(
                         is_separator_regex=False,
                     )
 
-                sub_docs = splitter.create_documents(
-                    [sec_text],
-                    metadatas=[{
-                        "source": source,
-                        "level": 2,
-                        "section_title": heading,
-                        "parent_id": section_chunk_id,
-                    }],
-                )
-
-                for sub_idx, sub_doc in enumerate(sub_docs):
+                sub_texts = splitter.split_text(sec_text)
+                for sub_idx, sub_text in enumerate(sub_texts):
                     sub_summary = generate_extractive_summary(
-                        sub_doc.page_content, max_sentences=2, max_tokens=80
+                        sub_text, max_sentences=2, max_tokens=80
                     )
-                    sub_doc.metadata.update({
-                        "chunk_id": str(uuid.uuid4()),
-                        "summary": sub_summary,
-                        "chunk_index": sub_idx,
-                        "total_chunks": len(sub_docs),
-                        "chunk_size": len(sub_doc.page_content),
-                        "token_count": len(sub_doc.page_content.split()),
-                    })
-                    all_chunks.append(sub_doc)
-
-    l0 = sum(1 for c in all_chunks if c.metadata['level'] == 0)
-    l1 = sum(1 for c in all_chunks if c.metadata['level'] == 1)
-    l2 = sum(1 for c in all_chunks if c.metadata['level'] == 2)
-    logging.info(f"✓ Created {len(all_chunks)} hierarchical chunks (L0={l0}, L1={l1}, L2={l2})")
+                    all_chunks.append(Document(
+                        page_content=sub_text,
+                        metadata={
+                            "source": source,
+                            "level": 2,
+                            "section_title": heading,
+                            "parent_id": section_chunk_id,
+                            "chunk_id": next_chunk_id(),
+                            "summary": sub_summary,
+                            "chunk_index": sub_idx,
+                            "total_chunks": len(sub_texts),
+                            "chunk_size": len(sub_text),
+                            "token_count": len(sub_text.split()),
+                        }
+                    ))
+
+    levels = Counter(c.metadata['level'] for c in all_chunks)
+    logging.info(
+        f"✓ Created {len(all_chunks)} hierarchical chunks "
+        f"(L0={levels[0]}, L1={levels[1]}, L2={levels[2]})"
+    )
     return all_chunks
 
 
+def drop_redundant_chunks(chunks: List[Document]) -> List[Document]:
+    """
+    Drop chunks that would only cost embedding calls and Weaviate objects:
+    leaf chunks with no letters or digits at all, and leaf chunks whose
+    text (case- and whitespace-normalised) repeats an earlier leaf, e.g.
+    boilerplate shared across files. Chunks referenced as a parent_id are
+    always kept so the hierarchy stays intact.
+    """
+    parent_ids = {c.metadata.get("parent_id") for c in chunks}
+    seen = set()
+    kept: List[Document] = []
+    empty = duplicates = 0
+    for chunk in chunks:
+        if chunk.metadata.get("chunk_id") in parent_ids:
+            kept.append(chunk)
+            continue
+        text = chunk.page_content
+        if not any(ch.isalnum() for ch in text):
+            empty += 1
+            continue
+        key = hashlib.blake2b(
+            " ".join(text.split()).lower().encode("utf-8"), digest_size=16
+        ).digest()
+        if key in seen:
+            duplicates += 1
+            continue
+        seen.add(key)
+        kept.append(chunk)
+
+    if empty or duplicates:
+        logging.info(
+            f"Dropped {duplicates} duplicate and {empty} empty chunk(s); "
+            f"{len(kept)} of {len(chunks)} remain"
+        )
+    return kept
+
+
+# ============================================================================
+# CONTENT-HASH CACHES (embeddings, entities)
+# ============================================================================
+
+def _content_cache_key(model: str, text: str) -> str:
+    return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+
+def _cached_compute(
+    cache_path: str,
+    table: str,
+    column: str,
+    keys: List[str],
+    inputs: List[Any],
+    compute,
+    encode,
+    decode,
+    label: str,
+    cacheable=None,
+) -> List[Any]:
+    """
+    Return compute(inputs) element-wise, reusing results stored under *keys*
+    in a SQLite table from previous runs. Only cache misses (deduplicated by
+    key) are passed to *compute*; results failing *cacheable* aren't stored.
+    """
+    conn = sqlite3.connect(cache_path)
+    try:
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, {column} BLOB)")
+
+        found: Dict[str, Any] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), 500):  # stay under SQLite's bound-parameter limit
+            batch = unique_keys[start:start + 500]
+            rows = conn.execute(
+                f"SELECT key, {column} FROM {table} WHERE key IN ({','.join('?' * len(batch))})",
+                batch,
+            )
+            for key, blob in rows:
+                found[key] = decode(blob)
+
+        missing = {k: x for k, x in zip(keys, inputs) if k not in found}
+        logging.info(f"{label} cache: {len(found)} hit(s), {len(missing)} miss(es)")
+
+        if missing:
+            results = compute(list(missing.values()))
+            fresh = [
+                (k, r) for k, r in zip(missing, results)
+                if cacheable is None or cacheable(r)
+            ]
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} (key, {column}) VALUES (?, ?)",
+                [(k, encode(r)) for k, r in fresh],
+            )
+            conn.commit()
+            found.update(zip(missing, results))
+    finally:
+        conn.close()
+
+    return [found[k] for k in keys]
+
+
+def embed_with_cache(embeddings, texts: List[str], cache_path: str, model: str) -> List[List[float]]:
+    """
+    Embed *texts*, reusing vectors for content seen on a previous run.
+
+    Vectors are stored as float32 blobs in SQLite keyed by sha256(model, text),
+    so unchanged chunks never hit the embedding API again. Only cache misses
+    (deduplicated) are sent to the embeddings backend. Vectors produced by a
+    different model than *model* (an API fallback model) are used for this
+    run but not persisted, so they can't outlive the outage under the
+    primary model's key. An empty cache_path disables the cache.
+    """
+    if not cache_path:
+        return embeddings.embed_documents(texts)
+
+    other_model_vectors = set()  # id()s of vectors from a fallback model
+
+    def compute(batch: List[str]) -> List[List[float]]:
+        vectors = []
+        for vec, produced_by in embeddings.embed_documents_with_models(batch):
+            if produced_by != model:
+                other_model_vectors.add(id(vec))
+            vectors.append(vec)
+        if other_model_vectors:
+            logging.warning(
+                f"{len(other_model_vectors)} vector(s) came from a fallback model; "
+                f"not caching them"
+            )
+        return vectors
+
+    return _cached_compute(
+        cache_path, "embeddings", "vector",
+        keys=[_content_cache_key(model, t) for t in texts],
+        inputs=texts,
+        compute=compute,
+        encode=lambda vec: array("f", vec).tobytes(),
+        decode=lambda blob: array("f", blob).tolist(),
+        label="Embedding",
+        # never persist an empty vector or one from another vector space
+        cacheable=lambda vec: bool(vec) and id(vec) not in other_model_vectors,
+    )
+
+
+def _spacy_model_key() -> str:
+    return f"{nlp.meta.get('lang')}_{nlp.meta.get('name')}-{nlp.meta.get('version')}"
+
+
+def extract_entities_with_cache(texts: List[str], cache_path: str) -> List[Dict[str, List[str]]]:
+    """
+    extract_entities_batch() with results memoized in SQLite by
+    sha256(spaCy model + version, text): NER only runs on unseen chunks.
+    An empty cache_path (or no spaCy model) skips the cache.
+    """
+    if not cache_path or nlp is None:
+        return extract_entities_batch(texts)
+
+    model = _spacy_model_key()
+    return _cached_compute(
+        cache_path, "entities", "entities",
+        keys=[_content_cache_key(model, t) for t in texts],
+        inputs=texts,
+        compute=extract_entities_batch,
+        encode=lambda ents: json.dumps(ents, separators=(",", ":"), ensure_ascii=False),
+        decode=json.loads,
+        label="Entity",
+    )
+
+
+def extract_entity_spans_with_cache(texts: List[str], cache_path: str) -> List[List[list]]:
+    """extract_entity_spans_batch() memoized in SQLite like the chunk-level cache."""
+    if not cache_path or nlp is None:
+        return extract_entity_spans_batch(texts)
+
+    return _cached_compute(
+        cache_path, "entity_spans", "spans",
+        keys=[_content_cache_key(_spacy_model_key(), t) for t in texts],
+        inputs=texts,
+        compute=extract_entity_spans_batch,
+        encode=lambda spans: json.dumps(spans, separators=(",", ":"), ensure_ascii=False),
+        decode=json.loads,
+        label="Document entity",
+    )
+
+
+def extract_chunk_entities(
+    documents: List[Document], chunks: List[Document], cache_path: str
+) -> List[Dict[str, List[str]]]:
+    """
+    Entities for every chunk, with NER run once per source document.
+
+    Hierarchy levels and sub-chunk overlap mean most chunk text is a slice
+    of its document; parsing each chunk separately re-NERs the same text
+    several times. Each chunk is located in its document with str.find and
+    gets the document entities that lie entirely inside it. Chunks that
+    aren't a verbatim slice (extractive summaries re-joined with spaces,
+    markdown-converted docx sections) and documents over nlp.max_length
+    fall back to per-chunk extract_entities_with_cache().
+    """
+    if nlp is None:
+        return [{} for _ in chunks]
+
+    doc_texts = {
+        d.metadata.get("source"): d.page_content
+        for d in documents if len(d.page_content) <= nlp.max_length
+    }
+    sources = list(doc_texts)
+    spans_by_source = dict(zip(
+        sources,
+        extract_entity_spans_with_cache([doc_texts[s] for s in sources], cache_path),
+    ))
+    starts_by_source = {
+        s: [span[0] for span in spans] for s, spans in spans_by_source.items()
+    }
+
+    results: List[Optional[Dict[str, List[str]]]] = [None] * len(chunks)
+    fallback: List[int] = []
+    for i, chunk in enumerate(chunks):
+        source = chunk.metadata.get("source")
+        text = chunk.page_content
+        offset = doc_texts[source].find(text) if source in doc_texts else -1
+        if offset < 0:
+            fallback.append(i)
+            continue
+        end = offset + len(text)
+        spans = spans_by_source[source]
+        grouped = defaultdict(set)
+        for start, stop, label, ent in spans[bisect_left(starts_by_source[source], offset):]:
+            if start >= end:
+                break
+            if stop <= end:
+                grouped[label].add(ent)
+        results[i] = {label: sorted(values) for label, values in grouped.items()}
+
+    logging.info(
+        f"Entities: {len(chunks) - len(fallback)} chunk(s) resolved from document-level NER, "
+        f"{len(fallback)} parsed individually"
+    )
+    if fallback:
+        fallback_entities = extract_entities_with_cache(
+            [chunks[i].page_content for i in fallback], cache_path
+        )
+        for i, entities in zip(fallback, fallback_entities):
+            results[i] = entities
+    return results
+
+
+def build_seed_embeddings(settings):
+    """
+    Pick the embeddings backend for ingestion (settings.EMBEDDING_BACKEND).
+
+    "api" (default) uses the HF Inference API (MultiFallbackEmbeddings).
+    "local" loads the model in-process with sentence-transformers — no
+    per-batch HTTP round trip, but a ~2 GB model download on first use.
+    "auto" tries local and falls back to the API when the package or model
+    can't be loaded. Both serve the same bge-m3 weights, so vectors match
+    what rag_service embeds at query time.
+    """
+    backend = (settings.EMBEDDING_BACKEND or "api").lower()
+    if backend in ("local", "auto"):
+        try:
+            embeddings = LocalEmbeddings(model_name=settings.EMBEDDING_MODEL)
+            logging.info(f"Using local embeddings backend ({embeddings.model_name})")
+            return embeddings
+        except Exception as e:
+            if backend == "local":
+                raise
+            logging.warning(f"Local embeddings unavailable ({e}); using HF Inference API")
+    logging.info(f"Using HF Inference API embeddings backend ({settings.EMBEDDING_MODEL})")
+    return MultiFallbackEmbeddings(
+        api_key=settings.HUGGINGFACE_API_KEY,
+        model_name=settings.EMBEDDING_MODEL,
+        batch_size=settings.EMBEDDING_BATCH_SIZE,
+        concurrency=settings.EMBEDDING_CONCURRENCY,
+    )
+
+
+# ============================================================================
+# WEAVIATE INDEX CONFIG
+# ============================================================================
+
+EMBEDDING_DIMS = 1024  # bge-m3 / bge-large-en-v1.5 (see MultiFallbackEmbeddings)
+
+# HNSW graph parameters. The collection is rebuilt from scratch on every seed,
+# so build cost is paid up front:
+#   ef_construction — candidate list while inserting. 128 keeps bulk build fast;
+#                     recall gains above it are marginal for a corpus this size.
+#   max_connections — edges per node (M). 16 halves graph memory vs 32 and is
+#                     plenty for ~1k-100k vectors.
+# Query-time ef stays dynamic (ef = limit * factor, clamped to [min, max]);
+# rag_service asks for at most 10 results, so this lands around 64–80.
+HNSW_EF_CONSTRUCTION = 128
+HNSW_MAX_CONNECTIONS = 16
+HNSW_DYNAMIC_EF_MIN = 64
+HNSW_DYNAMIC_EF_MAX = 256
+
+
+def _hnsw_index_config(compression: str):
+    """
+    HNSW config (tuned graph parameters above) with optional vector compression.
+
+    "bq": binary quantization — applies immediately, best for >=768 dims.
+    "pq": product quantization, 8 dims per segment (1024-dim → 128 one-byte
+          codes, ~32x smaller than float32). Weaviate only trains the codebook
+          itself (AutoPQ) when the server runs with ASYNC_INDEXING=true and
+          training_limit objects exist; otherwise the index stays uncompressed.
+          The bundled docker-compose service does not enable async indexing.
+    "none": plain float32 HNSW.
+    """
+    from weaviate.classes.config import Configure
+
+    mode = (compression or "none").lower()
+    if mode == "pq":
+        if EMBEDDING_DIMS % 8:
+            raise ValueError(
+                f"PQ needs EMBEDDING_DIMS divisible by 8 (got {EMBEDDING_DIMS})"
+            )
+        quantizer = Configure.VectorIndex.Quantizer.pq(
+            segments=EMBEDDING_DIMS // 8, centroids=256
+        )
+    elif mode == "bq":
+        quantizer = Configure.VectorIndex.Quantizer.bq()
+    else:
+        quantizer = None
+    return Configure.VectorIndex.hnsw(
+        ef_construction=HNSW_EF_CONSTRUCTION,
+        max_connections=HNSW_MAX_CONNECTIONS,
+        dynamic_ef_min=HNSW_DYNAMIC_EF_MIN,
+        dynamic_ef_max=HNSW_DYNAMIC_EF_MAX,
+        quantizer=quantizer,
+    )
+
+
 def seed_documents_from_local():
     """
     Loads documents from a local directory, processes them with hierarchical chunking,
@@ -579,7 +1093,9 @@ def seed_documents_from_local():
 
         # 1. Load documents from local directory using direct loaders (no unstructured)
         logging.info(f"Loading documents from local directory: {knowledge_base_path}")
-        documents = load_documents_from_directory(knowledge_base_path)
+        documents = load_documents_from_directory(
+            knowledge_base_path, cache_path=settings.DOCUMENT_CACHE_PATH
+        )
         
         if not documents:
             logging.warning("No documents found in the specified local directory.")
@@ -591,46 +1107,49 @@ def seed_documents_from_local():
         
         # Initialize embeddings
         logging.info(f"Initializing embeddings with model {settings.EMBEDDING_MODEL}...")
-        embeddings = MultiFallbackEmbeddings(
-            api_key=settings.HUGGINGFACE_API_KEY,
-            model_name=settings.EMBEDDING_MODEL,
-        )
+        embeddings = build_seed_embeddings(settings)
         
         # Apply semantic hierarchical chunking
-        chunks = semantic_hierarchical_chunking(documents)
+        chunks = drop_redundant_chunks(semantic_hierarchical_chunking(documents))
         
         # Enrich chunks with extracted entities
         logging.info("Enriching chunks with named entities...")
         enriched_chunks = []
-        for chunk in chunks:
-            entities = extract_entities(chunk.page_content)
+        all_entities = extract_chunk_entities(documents, chunks, settings.ENTITY_CACHE_PATH)
+        for chunk, entities in zip(chunks, all_entities):
             if entities:
                 chunk.metadata['entities'] = entities
+            # Shaped once here for the native OBJECT[] property — no JSON round-trip
+            chunk.metadata['entity_objects'] = [
+                {"label": label, "values": values} for label, values in entities.items()
+            ]
             enriched_chunks.append(chunk)
         
         logging.info(f"✓ Enriched {len(enriched_chunks)} chunks with entity metadata.")
         
         # Log a few examples of enriched chunks
-        for i, chunk in enumerate(enriched_chunks[:3]):
-            if 'entities' in chunk.metadata:
-                logging.info(f"  - Chunk {i+1} entities: {chunk.metadata['entities']}")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            for i, chunk in enumerate(enriched_chunks[:3]):
+                if 'entities' in chunk.metadata:
+                    logging.debug(f"  - Chunk {i+1} entities: {chunk.metadata['entities']}")
         
-        # Chunk summary table (concise production-friendly logging)
-        from collections import Counter
+        # Chunk summary table (concise production-friendly logging, one record)
         level_counts = Counter(c.metadata.get('level', '?') for c in enriched_chunks)
         source_counts = Counter(
             Path(c.metadata.get('source', 'unknown')).name for c in enriched_chunks
         )
-        logging.info("\n" + "="*60)
-        logging.info("SEEDING SUMMARY")
-        logging.info(f"  Total chunks: {len(enriched_chunks)}")
-        logging.info(f"  By level: L0={level_counts.get(0,0)}, L1={level_counts.get(1,0)}, L2={level_counts.get(2,0)}")
-        logging.info(f"  By source:")
-        for fname, cnt in source_counts.most_common():
-            logging.info(f"    {fname}: {cnt} chunks")
         avg_size = sum(len(c.page_content) for c in enriched_chunks) // max(len(enriched_chunks), 1)
-        logging.info(f"  Avg chunk size: {avg_size} chars")
-        logging.info("="*60 + "\n")
+        summary_lines = [
+            "=" * 60,
+            "SEEDING SUMMARY",
+            f"  Total chunks: {len(enriched_chunks)}",
+            f"  By level: L0={level_counts.get(0,0)}, L1={level_counts.get(1,0)}, L2={level_counts.get(2,0)}",
+            "  By source:",
+            *(f"    {fname}: {cnt} chunks" for fname, cnt in source_counts.most_common()),
+            f"  Avg chunk size: {avg_size} chars",
+            "=" * 60,
+        ]
+        logging.info("\n" + "\n".join(summary_lines) + "\n")
 
         # 3. Seed Weaviate (with readiness wait)
         logging.info(f"Connecting to Weaviate at {settings.WEAVIATE_HOST}:{settings.WEAVIATE_PORT}...")
@@ -670,7 +1189,7 @@ def seed_documents_from_local():
         client.collections.create(
             name=collection_name,
             vectorizer_config=Configure.Vectorizer.none(),
-            vector_index_config=Configure.VectorIndex.hnsw(),
+            vector_index_config=_hnsw_index_config(settings.WEAVIATE_VECTOR_COMPRESSION),
             properties=[
                 Property(name="chunk_id",      data_type=DataType.TEXT),
                 Property(name="content",       data_type=DataType.TEXT),
@@ -680,7 +1199,14 @@ def seed_documents_from_local():
                 Property(name="level",         data_type=DataType.INT),
                 Property(name="section_title", data_type=DataType.TEXT),
                 Property(name="parent_id",     data_type=DataType.TEXT),
-                Property(name="entities",      data_type=DataType.TEXT),
+                Property(
+                    name="entities",
+                    data_type=DataType.OBJECT_ARRAY,
+                    nested_properties=[
+                        Property(name="label",  data_type=DataType.TEXT),
+                        Property(name="values", data_type=DataType.TEXT_ARRAY),
+                    ],
+                ),
                 Property(name="chunk_index",   data_type=DataType.INT),
                 Property(name="total_chunks",  data_type=DataType.INT),
             ],
@@ -691,17 +1217,25 @@ def seed_documents_from_local():
         logging.info(f"Seeding {len(enriched_chunks)} hierarchically-structured chunks into Weaviate...")
         collection = client.collections.get(collection_name)
         
-        # Generate embeddings and seed documents with better error handling
-        for i, chunk in enumerate(enriched_chunks):
-            try:
-                logging.info(f"Embedding chunk {i+1}/{len(enriched_chunks)}...")
-                vector = embeddings.embed_query(chunk.page_content)
-                
+        # Embed all chunks up front in batched requests (one HTTP call per batch)
+        logging.info(f"Embedding {len(enriched_chunks)} chunks in batches of {embeddings.batch_size}...")
+        vectors = embed_with_cache(
+            embeddings,
+            [c.page_content for c in enriched_chunks],
+            settings.EMBEDDING_CACHE_PATH,
+            settings.EMBEDDING_MODEL,
+        )
+
+        # Stream objects through Weaviate's dynamic batcher (few gRPC calls, not one per chunk)
+        with collection.batch.dynamic() as batch:
+            for i, (chunk, vector) in enumerate(zip(enriched_chunks, vectors)):
                 if not vector or len(vector) == 0:
                     logging.error(f"✗ Empty embedding returned for chunk {i}")
                     continue
-                    
-                collection.data.insert(
+
+                batch.add_object(
+                    # Deterministic object UUID: re-adding a chunk overwrites rather than duplicates
+                    uuid=generate_uuid5(chunk.metadata.get("chunk_id", "")),
                     properties={
                         "chunk_id": chunk.metadata.get("chunk_id", ""),
                         "content": chunk.page_content,
@@ -711,16 +1245,30 @@ def seed_documents_from_local():
                         "level": chunk.metadata.get("level", 1),
                         "section_title": chunk.metadata.get("section_title", ""),
                         "parent_id": chunk.metadata.get("parent_id", ""),
-                        "entities": json.dumps(chunk.metadata.get("entities", {})),
+                        "entities": chunk.metadata["entity_objects"],
                         "chunk_index": chunk.metadata.get("chunk_index", 0),
                         "total_chunks": chunk.metadata.get("total_chunks", 1),
                     },
                     vector=vector
                 )
-                logging.info(f"✓ Seeded chunk {i+1} successfully")
-            except Exception as e:
-                logging.error(f"✗ Failed to seed chunk {i}: {e}")
-                continue
+
+        # One retry pass for objects the server rejected (timeouts, overload)
+        failed = collection.batch.failed_objects
+        if failed:
+            logging.warning(f"Retrying {len(failed)} chunk(s) that failed to seed...")
+            with collection.batch.fixed_size(batch_size=100) as batch:
+                for obj in failed:
+                    batch.add_object(
+                        uuid=obj.object_.uuid,
+                        properties=obj.object_.properties,
+                        vector=obj.object_.vector,
+                    )
+            failed = collection.batch.failed_objects
+
+        for obj in failed[:10]:
+            logging.error(f"✗ Failed to seed chunk: {obj.message}")
+        if failed:
+            logging.error(f"✗ {len(failed)} chunk(s) failed to seed")
         
         logging.info(f"✓ Successfully seeded Weaviate with {len(enriched_chunks)} document chunks (hierarchical structure with summaries).")
 
@@ -2,7 +2,13 @@
 
 import pytest
 import asyncio
+import base64
+import email
+import email.policy
+import json
+import httpx
 from unittest.mock import MagicMock, AsyncMock, patch
+from tenacity import wait_none
 from mcp_servers.calendar_server.main import calendar_server
 from mcp_servers.gmail_server.main import gmail_server
 
@@ -32,24 +38,36 @@ def _make_calendar_service(events=None):
     svc.events().insert.return_value.execute.return_value = _fake_calendar_event("created_01", "Test Meeting")
     # events().delete().execute()
     svc.events().delete.return_value.execute.return_value = None
+
+    # new_batch_http_request() — replays the callback for every added request
+    def _new_batch(callback=None):
+        added = []
+        batch = MagicMock()
+        batch.add.side_effect = lambda request, request_id=None: added.append(request_id)
+        batch.execute.side_effect = lambda: [callback(rid, None, None) for rid in added]
+        return batch
+
+    svc.new_batch_http_request.side_effect = _new_batch
     return svc
 
 
 # ── Gmail mock helpers ──────────────────────────────────────────────────────
 
-def _make_gmail_service(messages=None):
-    """Build a MagicMock that mimics googleapiclient gmail service calls."""
+def _make_gmail_http(messages=None):
+    """Build an httpx.AsyncClient whose transport mimics the Gmail REST API."""
     msg_stubs = messages or [{"id": "msg_001"}, {"id": "msg_002"}]
-    svc = MagicMock()
-
-    # users().messages().list().execute()
-    svc.users().messages().list.return_value.execute.return_value = {"messages": msg_stubs}
 
-    # users().messages().get().execute() — returns metadata
-    def _msg_get(**_kwargs):
-        m = MagicMock()
-        m.execute.return_value = {
-            "id": "msg_001",
+    def _handler(request):
+        path = request.url.path
+        # POST users/me/messages/send
+        if request.method == "POST" and path.endswith("/messages/send"):
+            return httpx.Response(200, json={"id": "sent_msg_001"})
+        # GET users/me/messages — message list
+        if path.endswith("/messages"):
+            return httpx.Response(200, json={"messages": msg_stubs})
+        # GET users/me/messages/{id} — returns metadata
+        return httpx.Response(200, json={
+            "id": path.rsplit("/", 1)[-1],
             "payload": {
                 "headers": [
                     {"name": "From",    "value": "sender@example.com"},
@@ -57,24 +75,32 @@ def _make_gmail_service(messages=None):
                     {"name": "Date",    "value": "Mon, 24 Feb 2026 10:00:00 +0000"},
                 ]
             }
-        }
-        return m
+        })
 
-    svc.users().messages().get.side_effect = _msg_get
+    return httpx.AsyncClient(transport=httpx.MockTransport(_handler))
 
-    # users().messages().send().execute()
-    svc.users().messages().send.return_value.execute.return_value = {"id": "sent_msg_001"}
-    return svc
+
+def _patch_gmail(http):
+    """Patch the Gmail server's OAuth credentials and HTTP client."""
+    creds = patch.object(gmail_server, "_get_credentials", new=AsyncMock(return_value=MagicMock(token="test-token")))
+    client = patch.object(gmail_server, "_get_http_client", return_value=http)
+    return creds, client
 
 
 # ── Calendar tests ──────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
 async def test_calendar_get_events():
-    """Test getting calendar events — mocks OAuth service layer."""
-    mock_svc = _make_calendar_service()
-    with patch.object(calendar_server, "_get_calendar_service", new=AsyncMock(return_value=mock_svc)):
+    """Test getting calendar events — mocks OAuth credentials and the REST transport."""
+    def _handler(request):
+        assert request.headers["Authorization"] == "Bearer test-token"
+        return httpx.Response(200, json={"items": [_fake_calendar_event()]})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    with patch.object(calendar_server, "_get_credentials", new=AsyncMock(return_value=MagicMock(token="test-token"))), \
+         patch.object(calendar_server, "_get_http_client", return_value=http):
         result = await calendar_server.execute_tool("get_events", {"days": 7})
+    await http.aclose()
     assert result["status"] == "success"
     assert "events" in result
     assert isinstance(result["events"], list)
@@ -96,41 +122,356 @@ async def test_calendar_create_event():
     assert result["event"]["title"] == "Test Meeting"
 
 
+@pytest.mark.asyncio
+async def test_calendar_create_event_not_retried_after_server_error():
+    """Test that a 5xx on insert isn't retried — the event may already exist."""
+    from googleapiclient.errors import HttpError
+
+    mock_svc = _make_calendar_service()
+    execute = mock_svc.events().insert.return_value.execute
+    execute.side_effect = HttpError(MagicMock(status=503), b"backend error")
+    with patch.object(calendar_server, "_get_calendar_service", new=AsyncMock(return_value=mock_svc)):
+        result = await calendar_server.execute_tool("create_event", {
+            "title": "Test Meeting",
+            "start_time": "2026-02-24T10:00:00",
+            "end_time": "2026-02-24T11:00:00",
+        })
+    assert result["status"] == "error"
+    assert execute.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_calendar_delete_events_bulk():
+    """Test bulk-deleting calendar events — mocks OAuth service layer."""
+    mock_svc = _make_calendar_service()
+    with patch.object(calendar_server, "_get_calendar_service", new=AsyncMock(return_value=mock_svc)):
+        result = await calendar_server.execute_tool("delete_events_bulk", {
+            "event_ids": ["evt_001", "evt_002", "evt_003"],
+        })
+    assert result["status"] == "success"
+    assert result["results"] == {"evt_001": "deleted", "evt_002": "deleted", "evt_003": "deleted"}
+
+
+@pytest.mark.asyncio
+async def test_calendar_delete_events_bulk_runs_batches_sequentially():
+    """Test that >50 IDs are split into batches that never execute concurrently."""
+    import threading
+    import time
+
+    mock_svc = _make_calendar_service()
+    replay = mock_svc.new_batch_http_request.side_effect
+    running, overlaps, executed = [0], [], []
+    lock = threading.Lock()
+
+    def _new_batch(callback=None):
+        batch = replay(callback=callback)
+        inner = batch.execute.side_effect
+
+        def _execute():
+            with lock:
+                running[0] += 1
+                overlaps.append(running[0])
+            time.sleep(0.01)
+            inner()
+            executed.append(threading.current_thread().name)
+            with lock:
+                running[0] -= 1
+
+        batch.execute.side_effect = _execute
+        return batch
+
+    mock_svc.new_batch_http_request.side_effect = _new_batch
+    ids = [f"evt_{i:03d}" for i in range(120)]
+    with patch.object(calendar_server, "_get_calendar_service", new=AsyncMock(return_value=mock_svc)):
+        result = await calendar_server.execute_tool("delete_events_bulk", {"event_ids": ids})
+    assert result["status"] == "success"
+    assert len(executed) == 3
+    assert max(overlaps) == 1
+
+
 # ── Gmail tests ─────────────────────────────────────────────────────────────
 
 @pytest.mark.asyncio
 async def test_gmail_get_emails():
-    """Test fetching emails — mocks OAuth service layer."""
-    mock_svc = _make_gmail_service()
-    with patch.object(gmail_server, "_get_gmail_service", new=AsyncMock(return_value=mock_svc)):
+    """Test fetching emails — mocks OAuth credentials and the REST transport."""
+    http = _make_gmail_http()
+    creds, client = _patch_gmail(http)
+    with creds, client:
         result = await gmail_server.execute_tool("get_emails", {"limit": 5})
+    await http.aclose()
     assert result["status"] == "success"
     assert "emails" in result
     assert isinstance(result["emails"], list)
+    assert [e["id"] for e in result["emails"]] == ["msg_001", "msg_002"]
+
+
+@pytest.mark.asyncio
+async def test_gmail_get_emails_bounds_limit_and_concurrency():
+    """Test a large limit is clamped and metadata GETs stay under the concurrency cap."""
+    from mcp_servers.gmail_server.main import GMAIL_MAX_EMAILS, GMAIL_METADATA_CONCURRENCY
+
+    running, peak, list_params = [0], [0], {}
+
+    async def _handler(request):
+        if request.url.path.endswith("/messages"):
+            list_params.update(request.url.params)
+            n = int(request.url.params["maxResults"])
+            return httpx.Response(200, json={"messages": [{"id": f"m{i}"} for i in range(n)]})
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(0.001)
+        running[0] -= 1
+        return httpx.Response(200, json={"payload": {"headers": []}})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    creds, client = _patch_gmail(http)
+    with creds, client:
+        result = await gmail_server.execute_tool("get_emails", {"limit": 500})
+    await http.aclose()
+    assert result["status"] == "success"
+    assert int(list_params["maxResults"]) == GMAIL_MAX_EMAILS
+    assert result["count"] == GMAIL_MAX_EMAILS
+    assert 1 < peak[0] <= GMAIL_METADATA_CONCURRENCY
 
 
 @pytest.mark.asyncio
 async def test_gmail_send_email():
-    """Test sending an email — mocks OAuth service layer."""
-    mock_svc = _make_gmail_service()
-    with patch.object(gmail_server, "_get_gmail_service", new=AsyncMock(return_value=mock_svc)):
+    """Test sending an email — mocks OAuth credentials and the REST transport."""
+    http = _make_gmail_http()
+    creds, client = _patch_gmail(http)
+    with creds, client:
         result = await gmail_server.execute_tool("send_email", {
             "to": "recipient@example.com",
             "subject": "Test Email",
             "body": "This is a test email",
         })
+    await http.aclose()
     assert result["status"] == "success"
     assert "message_id" in result
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("subject", ["Plain subject", "Résumé attached"])
+async def test_gmail_send_email_raw_message(subject):
+    """Test the raw RFC 5322 message posted to messages/send parses back intact."""
+    sent = {}
+
+    def _handler(request):
+        sent.update(json.loads(request.content))
+        return httpx.Response(200, json={"id": "sent_msg_001"})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    creds, client = _patch_gmail(http)
+    with creds, client:
+        result = await gmail_server.execute_tool("send_email", {
+            "to": "recipient@example.com",
+            "subject": subject,
+            "body": "Line one\nLine twö",
+            "cc": "cc@example.com",
+        })
+    await http.aclose()
+    assert result["status"] == "success"
+    msg = email.message_from_bytes(
+        base64.urlsafe_b64decode(sent["raw"]), policy=email.policy.default
+    )
+    assert msg["To"] == "recipient@example.com"
+    assert msg["Cc"] == "cc@example.com"
+    assert msg["Subject"] == subject
+    assert msg.get_content().splitlines() == ["Line one", "Line twö"]
+
+
+@pytest.mark.asyncio
+async def test_gmail_send_email_raw_message_edge_cases():
+    """Test non-LF line separators survive and a long Cc list is folded."""
+    sent = {}
+
+    def _handler(request):
+        sent.update(json.loads(request.content))
+        return httpx.Response(200, json={"id": "sent_msg_001"})
+
+    cc = ", ".join(f"person{i}@example.com" for i in range(60))
+    http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    creds, client = _patch_gmail(http)
+    with creds, client:
+        result = await gmail_server.execute_tool("send_email", {
+            "to": "recipient@example.com",
+            "subject": "Plain subject",
+            "body": "page\fbreak\r\nline\u2028sep",
+            "cc": cc,
+        })
+    await http.aclose()
+    assert result["status"] == "success"
+    raw = base64.urlsafe_b64decode(sent["raw"])
+    assert all(len(line) <= 998 for line in raw.splitlines())
+    msg = email.message_from_bytes(raw, policy=email.policy.default)
+    assert msg["Cc"] == cc
+    assert msg.get_content().rstrip("\n").split("\n") == ["page\fbreak", "line\u2028sep"]
+
+
+def test_gmail_pending_auth_reuses_logged_flow(tmp_path):
+    """Test repeated calls while auth is pending don't mint a new OAuth flow each time."""
+    from mcp_servers.oauth_flows import PendingOAuthFlows
+
+    creds_file = tmp_path / "credentials.json"
+    creds_file.write_text("{}")
+    flow = MagicMock()
+    flow.authorization_url.return_value = ("https://accounts.example/auth", "state-1")
+    with patch.object(gmail_server, "_token_path", str(tmp_path / "token.json")), \
+            patch.object(gmail_server, "_creds_path", str(creds_file)), \
+            patch.object(gmail_server, "_pending_flows", PendingOAuthFlows()), \
+            patch.object(gmail_server, "_logged_auth_state", None), \
+            patch("mcp_servers.gmail_server.main.Flow.from_client_secrets_file",
+                  return_value=flow) as from_secrets:
+        assert gmail_server._load_credentials() is None
+        assert gmail_server._load_credentials() is None
+        assert from_secrets.call_count == 1
+        assert "state-1" in gmail_server._pending_flows
+
+
+def test_gmail_save_token_concurrent_writes_stay_valid(tmp_path):
+    """Test overlapping token writes leave a complete token.json and no temp files."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    token_path = tmp_path / "token.json"
+    payloads = [MagicMock(to_json=MagicMock(return_value=json.dumps({"n": i, "pad": "x" * 4096})))
+                for i in range(20)]
+    with patch.object(gmail_server, "_token_path", str(token_path)):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(gmail_server._save_token, payloads))
+    assert json.loads(token_path.read_text())["n"] in range(20)
+    assert [p.name for p in tmp_path.iterdir()] == ["token.json"]
+
+
+def _no_retry_wait():
+    """Patch both Gmail retry policies to back off instantly."""
+    from contextlib import ExitStack
+
+    stack = ExitStack()
+    for method in ("_request_idempotent", "_request_non_idempotent"):
+        stack.enter_context(
+            patch.object(getattr(type(gmail_server), method).retry, "wait", wait_none())
+        )
+    return stack
+
+
+@pytest.mark.asyncio
+async def test_gmail_retries_rate_limited_requests():
+    """Test that 403 userRateLimitExceeded / 429 are retried and 400 is not."""
+    responses = [
+        httpx.Response(403, json={"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}),
+        httpx.Response(429),
+        httpx.Response(200, json={"id": "sent_msg_001"}),
+    ]
+
+    def _handler(request):
+        return responses.pop(0)
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    creds, client = _patch_gmail(http)
+    with creds, client, _no_retry_wait():
+        result = await gmail_server.execute_tool("send_email", {
+            "to": "recipient@example.com",
+            "subject": "Retry",
+            "body": "Body",
+        })
+        responses.append(httpx.Response(400, json={"error": {"message": "bad"}}))
+        failed = await gmail_server.execute_tool("read_email", {"email_id": "msg_001"})
+    await http.aclose()
+    assert result["status"] == "success"
+    assert failed["status"] == "error"
+    assert responses == []
+
+
+@pytest.mark.asyncio
+async def test_gmail_send_not_retried_after_server_error():
+    """Test that a 5xx on send isn't retried — the message may already have gone out."""
+    attempts = []
+
+    def _handler(request):
+        attempts.append(request.method)
+        return httpx.Response(503)
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    creds, client = _patch_gmail(http)
+    with creds, client, _no_retry_wait():
+        result = await gmail_server.execute_tool("send_email", {
+            "to": "recipient@example.com",
+            "subject": "Once",
+            "body": "Body",
+        })
+    await http.aclose()
+    assert result["status"] == "error"
+    assert attempts == ["POST"]
+
+
+@pytest.mark.asyncio
+async def test_gmail_send_retried_after_connect_error():
+    """Test that send is retried when the connection never got established."""
+    attempts = []
+
+    def _handler(request):
+        attempts.append(request.method)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, json={"id": "sent_msg_001"})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    creds, client = _patch_gmail(http)
+    with creds, client, _no_retry_wait():
+        result = await gmail_server.execute_tool("send_email", {
+            "to": "recipient@example.com",
+            "subject": "Retry",
+            "body": "Body",
+        })
+    await http.aclose()
+    assert result["status"] == "success"
+    assert attempts == ["POST", "POST"]
+
+
+@pytest.mark.asyncio
+async def test_gmail_read_email_nested_multipart():
+    """Test reading an email whose text/plain part sits inside a nested multipart."""
+    def _b64(text):
+        return base64.urlsafe_b64encode(text.encode("utf-8")).decode()
+
+    def _handler(request):
+        return httpx.Response(200, json={
+            "id": "msg_001",
+            "payload": {
+                "mimeType": "multipart/mixed",
+                "headers": [{"name": "Subject", "value": "Nested"}],
+                "parts": [
+                    {
+                        "mimeType": "multipart/alternative",
+                        "parts": [
+                            {"mimeType": "text/html", "body": {"data": _b64("<p>Héllo</p>")}},
+                            {"mimeType": "text/plain", "body": {"data": _b64("Héllo")}},
+                        ],
+                    },
+                    {"mimeType": "application/pdf", "body": {"attachmentId": "att_1"}},
+                ],
+            },
+        })
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    creds, client = _patch_gmail(http)
+    with creds, client:
+        result = await gmail_server.execute_tool("read_email", {"email_id": "msg_001"})
+    await http.aclose()
+    assert result["status"] == "success"
+    assert result["email"]["subject"] == "Nested"
+    assert result["email"]["body"] == "Héllo"
+
+
 def test_calendar_tools():
     """Test calendar tools list"""
     tools = calendar_server.get_available_tools()
-    assert len(tools) == 3
+    assert len(tools) == 4
     tool_names = [t["name"] for t in tools]
     assert "get_events" in tool_names
     assert "create_event" in tool_names
     assert "delete_event" in tool_names
+    assert "delete_events_bulk" in tool_names
 
 
 def test_gmail_tools():
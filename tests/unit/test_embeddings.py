@@ -0,0 +1,129 @@
+"""Unit tests for MultiFallbackEmbeddings batching — HTTP layer is stubbed."""
+
+from mcp_host.embeddings import MultiFallbackEmbeddings
+
+
+def _fake_embeddings(calls):
+    emb = MultiFallbackEmbeddings(api_key="test")
+
+    def fake_requests(inputs, model, timeout=60):
+        calls.append(inputs)
+        if isinstance(inputs, list):
+            return [[float(len(t))] for t in inputs]
+        return [float(len(inputs))]
+
+    emb._try_requests = fake_requests
+    return emb
+
+
+def test_embed_documents_sends_one_request_per_batch():
+    calls = []
+    emb = _fake_embeddings(calls)
+    texts = ["x" * i for i in range(1, 71)]
+
+    vectors = emb.embed_documents(texts)
+
+    assert vectors == [[float(len(t))] for t in texts]
+    # Batches run concurrently, so request order isn't fixed — output order is
+    assert sorted(len(c) for c in calls) == [6, 32, 32]
+
+
+def test_embed_query_sends_single_text():
+    calls = []
+    emb = _fake_embeddings(calls)
+
+    assert emb.embed_query("hello") == [5.0]
+    assert calls == ["hello"]
+
+
+def test_embed_documents_falls_back_to_single_texts_when_batch_fails():
+    calls = []
+    emb = _fake_embeddings(calls)
+    emb.MAX_RETRIES = 1
+    single = emb._try_requests
+
+    def flaky_requests(inputs, model, timeout=60):
+        if isinstance(inputs, list):
+            calls.append(inputs)
+            raise RuntimeError("payload too large")
+        return single(inputs, model, timeout)
+
+    emb._try_requests = flaky_requests
+    emb.batch_size = 2
+
+    assert emb.embed_documents(["ab", "abc"]) == [[2.0], [3.0]]
+    assert calls[-2:] == ["ab", "abc"]
+
+
+def test_requests_reuse_one_authorized_session():
+    emb = MultiFallbackEmbeddings(api_key="secret", concurrency=2)
+    sent = []
+
+    class FakeResponse:
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return [[1.0], [2.0]]
+
+    def fake_post(url, json, timeout):
+        sent.append((url, json))
+        return FakeResponse()
+
+    emb._session.post = fake_post
+
+    assert emb.embed_documents(["a", "b"]) == [[1.0], [2.0]]
+    assert emb._session.headers["Authorization"] == "Bearer secret"
+    assert sent[0][1] == {"inputs": ["a", "b"]}
+    assert sent[0][0].endswith(f"{emb.PRIMARY_MODEL}/pipeline/feature-extraction")
+
+
+def test_embed_query_caches_repeated_queries():
+    calls = []
+    emb = _fake_embeddings(calls)
+
+    first = emb.embed_query("hello")
+    first.append(99.0)  # callers get a copy, not the cached vector
+
+    assert emb.embed_query("hello") == [5.0]
+    assert emb.embed_query("hi") == [2.0]
+    assert calls == ["hello", "hi"]
+
+
+def test_embed_documents_with_models_reports_fallback_model():
+    calls = []
+    emb = _fake_embeddings(calls)
+    emb.MAX_RETRIES = 1
+    ok = emb._try_requests
+
+    def primary_down(inputs, model, timeout=60):
+        if model == emb.PRIMARY_MODEL:
+            raise RuntimeError("503")
+        return ok(inputs, model, timeout)
+
+    emb._try_requests = primary_down
+
+    assert emb.embed_documents_with_models(["ab"]) == [([2.0], emb.FALLBACK_MODELS[0])]
+
+
+def test_embed_query_does_not_cache_fallback_vectors():
+    calls = []
+    emb = _fake_embeddings(calls)
+    emb.MAX_RETRIES = 1
+    ok = emb._try_requests
+    primary_up = [False]
+
+    def flaky_primary(inputs, model, timeout=60):
+        if model == emb.PRIMARY_MODEL and not primary_up[0]:
+            raise RuntimeError("503")
+        return ok(inputs, model, timeout)
+
+    emb._try_requests = flaky_primary
+
+    emb.embed_query("hello")  # served by the fallback model
+    primary_up[0] = True
+    emb.working_model = None
+    emb.embed_query("hello")  # primary is back: must be re-embedded
+    emb.embed_query("hello")  # now cached
+
+    assert calls == ["hello", "hello"]
@@ -0,0 +1,30 @@
+"""Unit tests for the per-state OAuth flow store shared by the MCP servers."""
+
+from mcp_servers.oauth_flows import PendingOAuthFlows
+
+
+def test_pop_returns_flow_for_matching_state_once():
+    flows = PendingOAuthFlows()
+    flows.add("state-a", "flow-a")
+    flows.add("state-b", "flow-b")
+
+    assert flows.pop("state-b") == "flow-b"
+    assert flows.pop("state-b") is None
+    assert "state-a" in flows
+
+
+def test_pop_rejects_unknown_or_missing_state():
+    flows = PendingOAuthFlows()
+    flows.add("state-a", "flow-a")
+
+    assert flows.pop("state-x") is None
+    assert flows.pop(None) is None
+    assert len(flows) == 1
+
+
+def test_expired_flows_are_evicted():
+    flows = PendingOAuthFlows(ttl=-1)
+    flows.add("old", "flow-old")
+    flows.add("new", "flow-new")  # evicts "old" (already past its ttl)
+
+    assert flows.pop("old") is None
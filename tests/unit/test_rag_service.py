@@ -0,0 +1,21 @@
+"""Unit tests for RAGService result parsing — no Weaviate, no network."""
+
+from mcp_host.rag_service import RAGService
+
+
+def test_parse_entities_from_native_objects():
+    raw = [
+        {"label": "ORG", "values": ["Acme", "Globex"]},
+        {"label": "PERSON", "values": ["Ada"]},
+    ]
+    assert RAGService._safe_parse_entities(raw) == {"ORG": ["Acme", "Globex"], "PERSON": ["Ada"]}
+
+
+def test_parse_entities_from_legacy_json_string():
+    assert RAGService._safe_parse_entities('{"ORG": ["Acme"]}') == {"ORG": ["Acme"]}
+
+
+def test_parse_entities_tolerates_missing_or_bad_values():
+    assert RAGService._safe_parse_entities(None) == {}
+    assert RAGService._safe_parse_entities([]) == {}
+    assert RAGService._safe_parse_entities("not json") == {}
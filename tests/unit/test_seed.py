@@ -0,0 +1,438 @@
+"""Unit tests for seed.py text helpers — no Weaviate, no network."""
+
+from pathlib import Path
+
+import pytest
+from docx import Document as DocxDocument
+from langchain.schema import Document
+
+import seed
+from seed import (
+    _docx_to_markdown,
+    _entities_from_doc,
+    _summary_with_token_count,
+    drop_redundant_chunks,
+    extract_chunk_entities,
+    embed_with_cache,
+    extract_entities_with_cache,
+    generate_extractive_summary,
+    load_documents_from_directory,
+    semantic_hierarchical_chunking,
+    simple_sent_tokenize,
+)
+
+
+# ── sentence splitting ─────────────────────────────────────────────────────
+
+def test_sent_tokenize_splits_on_terminal_punctuation():
+    text = "  First sentence. Second one?  Third!\nFourth.  "
+    assert simple_sent_tokenize(text) == ["First sentence.", "Second one?", "Third!", "Fourth."]
+
+
+def test_sent_tokenize_max_sentences_matches_full_split():
+    text = "One. Two. Three. Four. Five."
+    for n in range(1, 7):
+        assert simple_sent_tokenize(text, max_sentences=n) == simple_sent_tokenize(text)[:n]
+
+
+def test_sent_tokenize_empty():
+    assert simple_sent_tokenize("   ") == []
+
+
+# ── extractive summaries ───────────────────────────────────────────────────
+
+def test_summary_takes_leading_sentences():
+    text = "Alpha beta. Gamma delta. Epsilon zeta. Eta theta."
+    assert generate_extractive_summary(text, max_sentences=2) == "Alpha beta. Gamma delta."
+
+
+def test_summary_respects_token_cap():
+    text = "one two three four. five six seven eight. nine ten."
+    # Second sentence would push past the cap, so only the first is kept
+    assert generate_extractive_summary(text, max_sentences=3, max_tokens=6) == "one two three four."
+
+
+def test_summary_token_count_matches_split():
+    for text in ["Alpha  beta.\tGamma delta. Epsilon.", "no terminal punctuation here", ""]:
+        summary, tokens = _summary_with_token_count(text, max_sentences=2, max_tokens=50)
+        assert summary == generate_extractive_summary(text, max_sentences=2, max_tokens=50)
+        assert tokens == len(summary.split())
+
+
+def test_summary_falls_back_to_prefix():
+    assert generate_extractive_summary("", max_sentences=3) == ""
+
+
+# ── docx parsing ───────────────────────────────────────────────────────────
+
+def test_docx_to_markdown_marks_headings_and_skips_blank_paragraphs(tmp_path):
+    doc = DocxDocument()
+    doc.add_heading("Intro", 1)
+    doc.add_paragraph("Body text here. " * 20)
+    doc.add_paragraph("   ")
+    doc.add_paragraph("1.2 Scope")
+    doc.add_heading("Details", 2)
+    doc.add_paragraph("More body.")
+    path = tmp_path / "sample.docx"
+    doc.save(str(path))
+
+    md_text, plain_text = _docx_to_markdown(path)
+
+    assert "# Intro" in md_text
+    assert "## 1.2 Scope" in md_text
+    assert "## Details" in md_text
+    assert plain_text.splitlines() == [
+        "Intro", ("Body text here. " * 20).strip(), "1.2 Scope", "Details", "More body."
+    ]
+
+
+
+def test_load_documents_from_directory_loads_all_types(tmp_path):
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "notes.txt").write_text("Plain notes. Second line.", encoding="utf-8")
+    (tmp_path / "nested" / "guide.md").write_text("# Guide\n\nSome body text.", encoding="utf-8")
+    (tmp_path / "ignored.csv").write_text("a,b", encoding="utf-8")
+    doc = DocxDocument()
+    doc.add_heading("Policy", 1)
+    doc.add_paragraph("Policy body.")
+    doc.save(str(tmp_path / "nested" / "policy.docx"))
+
+    docs = load_documents_from_directory(str(tmp_path))
+
+    by_name = {Path(d.metadata["source"]).name: d for d in docs}
+    assert set(by_name) == {"notes.txt", "guide.md", "policy.docx"}
+    assert {n: d.metadata["type"] for n, d in by_name.items()} == {
+        "notes.txt": "txt", "guide.md": "md", "policy.docx": "docx",
+    }
+    assert all(d.metadata["sections"] for d in docs)
+
+
+def test_load_documents_skips_hidden_files_and_directories(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "description.txt").write_text("Repo notes.", encoding="utf-8")
+    (tmp_path / "docs" / ".venv").mkdir(parents=True)
+    (tmp_path / "docs" / ".venv" / "README.md").write_text("# Package", encoding="utf-8")
+    (tmp_path / "docs" / ".draft.md").write_text("# Draft", encoding="utf-8")
+    (tmp_path / "docs" / "guide.md").write_text("# Guide\n\nSome body text.", encoding="utf-8")
+
+    docs = load_documents_from_directory(str(tmp_path))
+
+    assert [Path(d.metadata["source"]).name for d in docs] == ["guide.md"]
+
+
+def test_load_documents_parses_several_docx_in_sorted_order(tmp_path):
+    for name in ("c", "a", "b"):
+        doc = DocxDocument()
+        doc.add_heading(f"Heading {name}", 1)
+        doc.add_paragraph(f"Body {name}.")
+        doc.save(str(tmp_path / f"{name}.docx"))
+    (tmp_path / "notes.txt").write_text("Plain notes.", encoding="utf-8")
+
+    docs = load_documents_from_directory(str(tmp_path))
+
+    assert [Path(d.metadata["source"]).name for d in docs] == [
+        "a.docx", "b.docx", "c.docx", "notes.txt",
+    ]
+    assert "Body b." in docs[1].page_content
+
+
+def test_load_documents_replaces_invalid_utf8(tmp_path):
+    (tmp_path / "legacy.txt").write_bytes(b"Caf\xe9 menu. Open daily.")
+
+    docs = load_documents_from_directory(str(tmp_path))
+
+    assert [d.page_content for d in docs] == ["Caf\ufffd menu. Open daily."]
+
+
+def test_load_documents_reuses_cache_for_unchanged_files(tmp_path, monkeypatch):
+    kb = tmp_path / "kb"
+    kb.mkdir()
+    (kb / "a.txt").write_text("Alpha text.", encoding="utf-8")
+    (kb / "b.md").write_text("# B\n\nBeta text.", encoding="utf-8")
+    cache = str(tmp_path / "docs.sqlite")
+
+    first = load_documents_from_directory(str(kb), cache_path=cache)
+
+    loaded = []
+    real_load_one = seed._load_one
+
+    def counting_load_one(path):
+        loaded.append(path.name)
+        return real_load_one(path)
+
+    monkeypatch.setattr(seed, "_load_one", counting_load_one)
+    (kb / "a.txt").write_text("Alpha text, revised.", encoding="utf-8")
+
+    second = load_documents_from_directory(str(kb), cache_path=cache)
+
+    assert loaded == ["a.txt"]
+    by_name = {Path(d.metadata["source"]).name: d for d in second}
+    assert by_name["a.txt"].page_content == "Alpha text, revised."
+    assert by_name["b.md"].metadata == next(
+        d.metadata for d in first if d.metadata["source"].endswith("b.md")
+    )
+
+
+# ── hierarchical chunking ──────────────────────────────────────────────────
+
+def test_chunk_ids_unique_and_parents_resolve():
+    big = "Sentence number filler text here. " * 120
+    docs = [
+        Document(page_content="Short doc. Only one section.", metadata={"source": "a.md"}),
+        Document(
+            page_content=big,
+            metadata={"source": "b.md", "sections": [{"heading": "Big", "text": big}]},
+        ),
+    ]
+    chunks = semantic_hierarchical_chunking(docs)
+    ids = [c.metadata["chunk_id"] for c in chunks]
+
+    assert len(ids) == len(set(ids))
+    assert {c.metadata["level"] for c in chunks} == {0, 1, 2}
+    for c in chunks:
+        if c.metadata["parent_id"]:
+            assert c.metadata["parent_id"] in ids
+
+
+def test_section_within_sub_chunk_size_is_not_split():
+    text = "A short section. It fits in one sub-chunk."
+    docs = [Document(
+        page_content=text,
+        metadata={"source": "a.md", "sections": [{"heading": "Intro", "text": text}]},
+    )]
+
+    chunks = semantic_hierarchical_chunking(docs, section_max_chars=10, sub_chunk_size=1024)
+
+    assert [c.metadata["level"] for c in chunks] == [0, 1]
+    assert chunks[1].page_content == text
+
+
+# ── embedding cache ────────────────────────────────────────────────────────
+
+class _CountingEmbeddings:
+    def __init__(self, model="model-x"):
+        self.calls = []
+        self.model = model  # model the "API" answers with
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5] for t in texts]
+
+    def embed_documents_with_models(self, texts):
+        return [(vec, self.model) for vec in self.embed_documents(texts)]
+
+
+def test_embed_with_cache_only_embeds_misses(tmp_path):
+    cache = str(tmp_path / "embed.sqlite")
+    emb = _CountingEmbeddings()
+
+    first = embed_with_cache(emb, ["aa", "bbb", "aa"], cache, "model-x")
+    second = embed_with_cache(emb, ["bbb", "cccc"], cache, "model-x")
+
+    assert first == [[2.0, 0.5], [3.0, 0.5], [2.0, 0.5]]
+    assert second == [[3.0, 0.5], [4.0, 0.5]]
+    assert emb.calls == [["aa", "bbb"], ["cccc"]]
+
+
+def test_embed_with_cache_is_keyed_by_model(tmp_path):
+    cache = str(tmp_path / "embed.sqlite")
+    emb = _CountingEmbeddings()
+
+    embed_with_cache(emb, ["aa"], cache, "model-x")
+    emb.model = "model-y"
+    embed_with_cache(emb, ["aa"], cache, "model-y")
+
+    assert emb.calls == [["aa"], ["aa"]]
+
+
+def test_embed_with_cache_does_not_persist_fallback_vectors(tmp_path):
+    cache = str(tmp_path / "embed.sqlite")
+    emb = _CountingEmbeddings(model="fallback-model")
+
+    first = embed_with_cache(emb, ["aa"], cache, "model-x")
+    emb.model = "model-x"
+    embed_with_cache(emb, ["aa"], cache, "model-x")
+    embed_with_cache(emb, ["aa"], cache, "model-x")
+
+    assert first == [[2.0, 0.5]]
+    # The fallback vector was used once but never cached; the primary one is
+    assert emb.calls == [["aa"], ["aa"]]
+
+
+def test_entities_grouped_deduplicated_and_sorted():
+    class Ent:
+        def __init__(self, text, label):
+            self.text, self.label_ = text, label
+
+    class Doc:
+        ents = [Ent("Globex", "ORG"), Ent("Acme", "ORG"), Ent("Globex", "ORG"), Ent("Ada", "PERSON")]
+
+    assert _entities_from_doc(Doc()) == {"ORG": ["Acme", "Globex"], "PERSON": ["Ada"]}
+
+
+def test_entity_cache_only_runs_ner_on_misses(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_batch(texts):
+        calls.append(list(texts))
+        return [{"ORG": [t.upper()]} if t != "none" else {} for t in texts]
+
+    class FakeNlp:
+        meta = {"lang": "en", "name": "core_web_sm", "version": "3.7.1"}
+
+    monkeypatch.setattr(seed, "nlp", FakeNlp())
+    monkeypatch.setattr(seed, "extract_entities_batch", fake_batch)
+    cache = str(tmp_path / "ner.sqlite")
+
+    first = extract_entities_with_cache(["acme", "none"], cache)
+    second = extract_entities_with_cache(["none", "acme", "globex"], cache)
+
+    assert first == [{"ORG": ["ACME"]}, {}]
+    assert second == [{}, {"ORG": ["ACME"]}, {"ORG": ["GLOBEX"]}]
+    assert calls == [["acme", "none"], ["globex"]]
+
+
+def test_chunk_entities_come_from_document_level_ner(monkeypatch):
+    doc_text = "Acme hired Ada Lovelace. Globex sued Acme."
+    document = Document(page_content=doc_text, metadata={"source": "a.txt"})
+
+    def chunk(text):
+        return Document(page_content=text, metadata={"source": "a.txt"})
+
+    def span(text, label):
+        start = doc_text.index(text)
+        return [start, start + len(text), label, text]
+
+    doc_calls, chunk_calls = [], []
+
+    def fake_spans(texts):
+        doc_calls.append(list(texts))
+        return [[span("Acme", "ORG"), span("Ada Lovelace", "PERSON"), span("Globex", "ORG")]]
+
+    def fake_batch(texts):
+        chunk_calls.append(list(texts))
+        return [{"ORG": ["Initech"]} for _ in texts]
+
+    class FakeNlp:
+        max_length = 1_000_000
+
+    monkeypatch.setattr(seed, "nlp", FakeNlp())
+    monkeypatch.setattr(seed, "extract_entity_spans_batch", fake_spans)
+    monkeypatch.setattr(seed, "extract_entities_batch", fake_batch)
+
+    entities = extract_chunk_entities(
+        [document],
+        [chunk(doc_text), chunk("Ada Lovelace. Globex"), chunk("Initech  summary.")],
+        cache_path="",
+    )
+
+    assert entities == [
+        {"ORG": ["Acme", "Globex"], "PERSON": ["Ada Lovelace"]},
+        {"PERSON": ["Ada Lovelace"], "ORG": ["Globex"]},
+        {"ORG": ["Initech"]},
+    ]
+    assert doc_calls == [[doc_text]]
+    assert chunk_calls == [["Initech  summary."]]
+
+
+def test_seed_embeddings_fall_back_to_api_when_local_unavailable(monkeypatch):
+    from types import SimpleNamespace
+
+    from mcp_host.embeddings import MultiFallbackEmbeddings
+
+    def unavailable(**kwargs):
+        raise ImportError("No module named 'sentence_transformers'")
+
+    monkeypatch.setattr(seed, "LocalEmbeddings", unavailable)
+    settings = SimpleNamespace(
+        EMBEDDING_BACKEND="auto",
+        EMBEDDING_MODEL="BAAI/bge-m3",
+        HUGGINGFACE_API_KEY="test",
+        EMBEDDING_BATCH_SIZE=8,
+        EMBEDDING_CONCURRENCY=2,
+    )
+
+    embeddings = seed.build_seed_embeddings(settings)
+
+    assert isinstance(embeddings, MultiFallbackEmbeddings)
+    assert embeddings.batch_size == 8
+
+    settings.EMBEDDING_BACKEND = "local"
+    with pytest.raises(ImportError):
+        seed.build_seed_embeddings(settings)
+
+
+def test_seed_embeddings_default_to_api_even_when_local_installed(monkeypatch):
+    from types import SimpleNamespace
+
+    from mcp_host.embeddings import MultiFallbackEmbeddings
+
+    def must_not_load(**kwargs):
+        raise AssertionError("local model loaded for the api backend")
+
+    monkeypatch.setattr(seed, "LocalEmbeddings", must_not_load)
+    settings = SimpleNamespace(
+        EMBEDDING_BACKEND="api",
+        EMBEDDING_MODEL="BAAI/bge-m3",
+        HUGGINGFACE_API_KEY="test",
+        EMBEDDING_BATCH_SIZE=8,
+        EMBEDDING_CONCURRENCY=2,
+    )
+
+    assert isinstance(seed.build_seed_embeddings(settings), MultiFallbackEmbeddings)
+    assert seed.Settings.model_fields["EMBEDDING_BACKEND"].default == "api"
+
+
+def test_entity_batch_keeps_small_corpora_in_process(monkeypatch):
+    seen = {}
+
+    class FakeNlp:
+        def pipe(self, texts, batch_size, n_process):
+            seen["n_process"] = n_process
+            return [type("Doc", (), {"ents": []})() for _ in texts]
+
+    monkeypatch.setattr(seed, "nlp", FakeNlp())
+
+    assert seed.extract_entities_batch(["a", "b", "c"], batch_size=64) == [{}, {}, {}]
+    assert seen["n_process"] == 1
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("## Overview", True),
+        ("2.1 Scope of work", True),
+        ("Appendix A", True),
+        ("COMPANY POLICIES", True),
+        ("This is an ordinary sentence about the weather.", False),
+    ],
+)
+def test_is_text_heading(line, expected):
+    assert seed._is_text_heading(line) is expected
+
+
+def test_docx_heading_heuristic_checks_text_before_run_formatting():
+    class Para:
+        @property
+        def runs(self):
+            raise AssertionError("run formatting read for a text-detectable heading")
+
+    assert seed._is_heading_by_heuristic(Para(), text="2.1 Scope", style="Normal")
+    assert seed._is_heading_by_heuristic(Para(), text="LEAVE POLICY", style="Normal")
+
+
+def test_drop_redundant_chunks_keeps_parents_and_first_copy():
+    def chunk(cid, text, parent=""):
+        return Document(page_content=text, metadata={"chunk_id": cid, "parent_id": parent})
+
+    chunks = [
+        chunk("doc", "Summary"),
+        chunk("s1", "Shared footer text", parent="doc"),
+        chunk("s2", "shared   FOOTER text", parent="doc"),
+        chunk("s3", " -- \n ", parent="doc"),
+        chunk("s4", "Unique policy text", parent="doc"),
+    ]
+
+    kept = drop_redundant_chunks(chunks)
+
+    assert [c.metadata["chunk_id"] for c in kept] == ["doc", "s1", "s4"]
@@ -0,0 +1,26 @@
+"""Unit tests for VoiceService's binding to the shared HTTP client."""
+
+import asyncio
+
+from mcp_host.http_client import close_http_client, get_http_client
+from mcp_host.voice_service import VoiceService
+
+
+def test_client_rebinds_after_shared_http_client_closed(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    service = VoiceService()
+
+    first = service.client
+    assert service.client is first
+
+    asyncio.run(close_http_client())
+    second = service.client
+
+    assert second is not first
+    assert not get_http_client().is_closed
+    asyncio.run(close_http_client())
+
+
+def test_client_is_none_without_api_key(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    assert VoiceService().client is None